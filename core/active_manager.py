@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import errno
 import json
 import os
 import shutil
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson as _ORJSON  # type: ignore
+except Exception:  # pragma: no cover - orjson is optional
+    _ORJSON = None
+
+# Set ZPRINT_PRETTY_META to keep indented model.json output without orjson installed.
+_PRETTY_META = bool(os.environ.get("ZPRINT_PRETTY_META"))
 
 
 class ActiveModelError(RuntimeError):
@@ -47,15 +59,22 @@ def _copy_model_gcodes_to_root(model: dict, models_root: str) -> List[str]:
         raise ActiveModelError("This model does not list any G-code entries.")
 
     os.makedirs(models_root, exist_ok=True)
+    try:
+        existing_names = {name.lower() for name in os.listdir(models_root)}
+    except OSError:
+        existing_names = set()
 
     folder_leaf = os.path.basename(folder.rstrip(os.sep)) or "model"
     recorded = set(name.lower() for name in _existing_active_names(model))
     used_dest = set(recorded)
 
     result_names: List[str] = []
-    copied_paths: List[str] = []
     missing_sources: List[str] = []
     current_filename = ""
+    stat_cache: Dict[str, Optional[os.stat_result]] = {}
+    # (filename, source, dest_path) jobs, resolved serially so collisions are settled before copying
+    planned: List[Tuple[str, str, str]] = []
+    planned_paths: set[str] = set()
 
     try:
         for entry in gcodes:
@@ -64,15 +83,16 @@ def _copy_model_gcodes_to_root(model: dict, models_root: str) -> List[str]:
                 continue
 
             source = os.path.join(folder, current_filename)
-            if not os.path.isfile(source):
+            source_stat = _cached_stat(source, stat_cache)
+            if source_stat is None or not stat.S_ISREG(source_stat.st_mode):
                 missing_sources.append(current_filename)
                 continue
 
             dest_name = current_filename
             dest_path = os.path.join(models_root, dest_name)
 
-            if os.path.exists(dest_path):
-                if _files_are_same(source, dest_path):
+            if dest_path in planned_paths or _cached_stat(dest_path, stat_cache) is not None:
+                if _files_are_same(source, dest_path, stat_cache):
                     if dest_name not in result_names:
                         result_names.append(dest_name)
                     used_dest.add(dest_name.lower())
@@ -84,44 +104,45 @@ def _copy_model_gcodes_to_root(model: dict, models_root: str) -> List[str]:
                     extra = "" if suffix == 0 else f"_{suffix}"
                     candidate = f"{name_root}__{folder_leaf}{extra}{name_ext}"
                     candidate_path = os.path.join(models_root, candidate)
-                    if not os.path.exists(candidate_path):
+                    if candidate.lower() not in existing_names:
                         dest_name = candidate
                         dest_path = candidate_path
                         break
-                    if _files_are_same(source, candidate_path):
+                    if _files_are_same(source, candidate_path, stat_cache):
                         dest_name = candidate
                         dest_path = candidate_path
                         break
                     suffix += 1
 
-            if dest_name.lower() in used_dest and not _files_are_same(source, os.path.join(models_root, dest_name)):
+            if dest_name.lower() in used_dest and not _files_are_same(
+                source, os.path.join(models_root, dest_name), stat_cache
+            ):
                 name_root, name_ext = os.path.splitext(dest_name)
                 suffix = 1
                 while True:
                     candidate = f"{name_root}_{suffix}{name_ext}"
                     candidate_path = os.path.join(models_root, candidate)
                     if candidate.lower() not in used_dest and (
-                        not os.path.exists(candidate_path) or _files_are_same(source, candidate_path)
+                        candidate.lower() not in existing_names
+                        or _files_are_same(source, candidate_path, stat_cache)
                     ):
                         dest_name = candidate
                         dest_path = candidate_path
                         break
                     suffix += 1
 
-            shutil.copy2(source, dest_path)
-            copied_paths.append(dest_path)
+            planned.append((current_filename, source, dest_path))
+            planned_paths.add(dest_path)
+            existing_names.add(dest_name.lower())
             used_dest.add(dest_name.lower())
             if dest_name not in result_names:
                 result_names.append(dest_name)
-    except Exception as exc:  # roll back any partially copied files
-        for path in copied_paths:
-            if os.path.isfile(path):
-                try:
-                    os.remove(path)
-                except Exception:
-                    pass
+    except Exception as exc:
         raise ActiveModelError(f'Failed to copy G-code file "{current_filename}": {exc}') from exc
 
+    if planned:
+        _copy_planned_gcodes(planned)
+
     if not result_names:
         if missing_sources:
             missing_display = ", ".join(sorted(set(missing_sources)))
@@ -131,14 +152,133 @@ def _copy_model_gcodes_to_root(model: dict, models_root: str) -> List[str]:
     return result_names
 
 
+_FAST_COPY_FALLBACK_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+    errno.ENOTSOCK,
+}
+
+
+def _fast_copyfile(source: str, dest: str) -> None:
+    """Copy file data between descriptors, letting the kernel move the bytes.
+
+    Tries ``os.copy_file_range`` first, then ``os.sendfile``, and finally a
+    plain 1 MiB read/write loop. Platforms without ``copy_file_range`` (e.g.
+    Windows) go straight to ``shutil.copyfile``, which already uses the native
+    fast path there. Metadata is not copied; callers use ``shutil.copystat``.
+    """
+
+    if not hasattr(os, "copy_file_range") and not hasattr(os, "sendfile"):
+        shutil.copyfile(source, dest)
+        return
+
+    src_fd = os.open(source, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if _files_are_same(source, dest):
+            raise shutil.SameFileError(f"{source!r} and {dest!r} are the same file")
+        dst_fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            remaining = os.fstat(src_fd).st_size
+            for copier in (_copy_range_chunks, _sendfile_chunks):
+                try:
+                    remaining = copier(src_fd, dst_fd, remaining)
+                except OSError as exc:
+                    if exc.errno not in _FAST_COPY_FALLBACK_ERRNOS:
+                        raise
+                    continue
+                if remaining <= 0:
+                    return
+            while True:
+                chunk = os.read(src_fd, 1024 * 1024)
+                if not chunk:
+                    break
+                view = memoryview(chunk)
+                while view:
+                    written = os.write(dst_fd, view)
+                    view = view[written:]
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _copy_range_chunks(src_fd: int, dst_fd: int, remaining: int) -> int:
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        raise OSError(errno.ENOSYS, "copy_file_range is unavailable")
+    while remaining > 0:
+        copied = copy_range(src_fd, dst_fd, remaining)
+        if copied == 0:
+            break
+        remaining -= copied
+    return remaining
+
+
+def _sendfile_chunks(src_fd: int, dst_fd: int, remaining: int) -> int:
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is None:
+        raise OSError(errno.ENOSYS, "sendfile is unavailable")
+    while remaining > 0:
+        sent = sendfile(dst_fd, src_fd, None, remaining)
+        if sent == 0:
+            break
+        remaining -= sent
+    return remaining
+
+
+def _copy_planned_gcodes(planned: List[Tuple[str, str, str]]) -> None:
+    """Copy resolved (filename, source, dest) jobs concurrently, rolling back on failure."""
+    copied_paths: List[str] = []
+    copied_lock = threading.Lock()
+
+    def _copy_one(source: str, dest_path: str) -> None:
+        _fast_copyfile(source, dest_path)
+        with copied_lock:
+            copied_paths.append(dest_path)
+        shutil.copystat(source, dest_path, follow_symlinks=True)
+
+    failure: Optional[Tuple[str, BaseException]] = None
+    with ThreadPoolExecutor(max_workers=min(4, len(planned))) as executor:
+        futures = [
+            (filename, executor.submit(_copy_one, source, dest_path))
+            for filename, source, dest_path in planned
+        ]
+        for filename, future in futures:
+            exc = future.exception()
+            if exc is not None and failure is None:
+                failure = (filename, exc)
+
+    if failure is not None:  # roll back any partially copied files
+        for path in copied_paths:
+            if os.path.isfile(path):
+                try:
+                    os.remove(path)
+                except Exception:
+                    pass
+        filename, exc = failure
+        raise ActiveModelError(f'Failed to copy G-code file "{filename}": {exc}') from exc
+
+
 def _remove_active_gcodes(model: dict, models_root: str) -> None:
-    for name in _existing_active_names(model):
-        target = os.path.join(models_root, name)
-        if os.path.isfile(target):
-            try:
-                os.remove(target)
-            except Exception:
-                pass
+    names = list(_existing_active_names(model))
+    if not names:
+        return
+    try:
+        with os.scandir(models_root) as entries:
+            files = {os.path.normcase(entry.name): entry for entry in entries if entry.is_file()}
+    except OSError:
+        return
+    for name in names:
+        entry = files.pop(os.path.normcase(name), None)
+        if entry is None:
+            continue
+        try:
+            os.unlink(entry.path)
+        except Exception:
+            pass
 
 
 def _existing_active_names(model: dict) -> Iterable[str]:
@@ -169,25 +309,55 @@ def _update_model_active_metadata(model: dict, active: bool, active_files: List[
 
     meta_path = os.path.join(folder, "model.json")
     try:
-        with open(meta_path, "w", encoding="utf-8") as fh:
-            json.dump(meta, fh, ensure_ascii=False, indent=2)
+        _write_meta_bytes(meta_path, _serialize_meta(meta))
     except Exception as exc:
         raise ActiveModelError(f"Unable to write model metadata: {exc}") from exc
 
     return meta, timestamp
 
 
-def _files_are_same(path_a: str, path_b: str) -> bool:
+def _serialize_meta(meta: dict) -> bytes:
+    if _ORJSON is not None:
+        try:
+            return _ORJSON.dumps(meta, option=_ORJSON.OPT_INDENT_2 | _ORJSON.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    if _PRETTY_META:
+        return json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8")
+    # the stdlib's indented encoder falls back to a pure-Python path; compact output stays in C
+    return (json.dumps(meta, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _write_meta_bytes(path: str, data: bytes) -> None:
+    """Write an already-serialized metadata blob with a single buffered write."""
+    with open(path, "wb") as fh:
+        fh.write(data)
+
+
+def _cached_stat(path: str, cache: Optional[Dict[str, Optional[os.stat_result]]] = None) -> Optional[os.stat_result]:
+    """Return ``os.stat(path)`` or ``None`` if missing, memoized in ``cache`` when given."""
+    if cache is not None and path in cache:
+        return cache[path]
+    try:
+        result: Optional[os.stat_result] = os.stat(path)
+    except (OSError, ValueError):
+        result = None
+    if cache is not None:
+        cache[path] = result
+    return result
+
+
+def _files_are_same(
+    path_a: str,
+    path_b: str,
+    stat_cache: Optional[Dict[str, Optional[os.stat_result]]] = None,
+) -> bool:
     if not path_a or not path_b:
         return False
-    if not os.path.exists(path_a) or not os.path.exists(path_b):
+    stat_a = _cached_stat(path_a, stat_cache)
+    stat_b = _cached_stat(path_b, stat_cache)
+    if stat_a is None or stat_b is None:
         return False
-    try:
-        return os.path.samefile(path_a, path_b)
-    except Exception:
-        try:
-            stat_a = os.stat(path_a)
-            stat_b = os.stat(path_b)
-        except Exception:
-            return False
-        return stat_a.st_size == stat_b.st_size and int(stat_a.st_mtime) == int(stat_b.st_mtime)
+    if stat_a.st_ino and stat_b.st_ino:
+        return stat_a.st_ino == stat_b.st_ino and stat_a.st_dev == stat_b.st_dev
+    return stat_a.st_size == stat_b.st_size and int(stat_a.st_mtime) == int(stat_b.st_mtime)
@@ -2,127 +2,196 @@
 
 from __future__ import annotations
 
+import mmap
 import os
 import re
+from functools import lru_cache
 from typing import Dict
 
 __all__ = ["extract_metadata_from_gcode"]
 
 
-def _format_duration_from_seconds(seconds: int) -> str:
-    seconds = max(int(seconds), 0)
-    hours, remainder = divmod(seconds, 3600)
-    minutes, secs = divmod(remainder, 60)
-    parts: list[str] = []
+def _format_duration(hours: int, minutes: int) -> str:
+    if hours and minutes:
+        return f"{hours}h {minutes}m"
     if hours:
-        parts.append(f"{hours}h")
+        return f"{hours}h"
     if minutes:
-        parts.append(f"{minutes}m")
-    if not parts:
-        return "0m"
-    return " ".join(parts)
+        return f"{minutes}m"
+    return "0m"
 
 
-def _normalize_duration_tokens(tokens: list[tuple[int, str]]) -> str:
-    hours = minutes = 0
-    seconds = 0
-    for value, unit in tokens:
-        if unit == "h":
+def _format_duration_from_seconds(seconds: int) -> str:
+    hours, remainder = divmod(max(int(seconds), 0), 3600)
+    return _format_duration(hours, remainder // 60)
+
+
+def _parse_duration(text: str) -> str | None:
+    """Collapse ``1h 2m 30s`` style text to hours/minutes, or ``None`` if no tokens."""
+    hours = minutes = seconds = 0
+    found = False
+    for match in _HMS_RE.finditer(text):
+        found = True
+        value = int(match.group(1))
+        unit = match.group(2)
+        if unit in "hH":
             hours += value
-        elif unit == "m":
+        elif unit in "mM":
             minutes += value
-        elif unit == "s":
+        else:
             seconds += value
+    if not found:
+        return None
     if seconds and not minutes:
         minutes = max(1, seconds // 60)
-    parts: list[str] = []
-    if hours:
-        parts.append(f"{hours}h")
-    if minutes:
-        parts.append(f"{minutes}m")
-    if not parts:
-        return "0m"
-    return " ".join(parts)
+    return _format_duration(hours, minutes)
+
+
+# Every annotation we understand contains one of these keywords, so a single
+# C-level pass over the mapped file finds the only lines worth decoding.
+_METADATA_KEY_RE = re.compile(
+    rb"TIME:|estimated printing time|filament_(?:settings_id|spool_name|brand|type|colou?r)",
+    re.IGNORECASE,
+)
+
+
+# Precompiled regexes for common slicer annotations.
+_MATERIAL_RES = (
+    re.compile(r"filament_settings_id\s*=\s*\"?([^\";]+)\"?", re.IGNORECASE),
+    re.compile(r"filament_spool_name\s*=\s*\"?([^\";]+)\"?", re.IGNORECASE),
+    re.compile(r"filament_brand\s*=\s*\"?([^\";]+)\"?", re.IGNORECASE),
+    re.compile(r"filament_type\s*=\s*\"?([^\";]+)\"?", re.IGNORECASE),
+)
+_COLOUR_RES = (
+    re.compile(r"filament_colou?r\s*=\s*\"?([^\";]+)\"?", re.IGNORECASE),
+)
+_PRUSA_TIME_RE = re.compile(r"estimated printing time.*=\s*([0-9hms ]+)", re.IGNORECASE)
+_HMS_RE = re.compile(r"(\d+)\s*([hms])", re.IGNORECASE)
+_HEX_COLOUR_RE = re.compile(r"#?[0-9a-fA-F]{6}")
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=64)
+def _colour_strip_re(colour: str) -> re.Pattern[str]:
+    return re.compile(rf"\s*{re.escape(colour)}\b", re.IGNORECASE)
+
+
+# Slicers write their annotations in a header (Cura, Bambu/Orca) or a trailing
+# config block (PrusaSlicer/SuperSlicer); the toolpath in between never holds
+# any, so large files only have these two windows searched.
+_HEAD_SCAN_BYTES = 512 * 1024
+_TAIL_SCAN_BYTES = 1024 * 1024
+
+
+def _scan_ranges(buffer: mmap.mmap, max_lines: int | None) -> list[tuple[int, int]]:
+    size = len(buffer)
+    if isinstance(max_lines, int) and max_lines > 0:
+        position = 0
+        for _ in range(max_lines):
+            newline = buffer.find(b"\n", position)
+            if newline < 0:
+                return [(0, size)]
+            position = newline + 1
+        return [(0, position)]
+    if size <= _HEAD_SCAN_BYTES + _TAIL_SCAN_BYTES:
+        return [(0, size)]
+    head_end = buffer.find(b"\n", _HEAD_SCAN_BYTES)
+    head_end = size if head_end < 0 else head_end + 1
+    tail_start = buffer.find(b"\n", size - _TAIL_SCAN_BYTES)
+    tail_start = size if tail_start < 0 else tail_start + 1
+    if tail_start <= head_end:
+        return [(0, size)]
+    return [(0, head_end), (tail_start, size)]
+
+
+def _scan_range(
+    buffer: mmap.mmap,
+    start: int,
+    end: int,
+    result: Dict[str, str],
+) -> None:
+    last_line_start = -1
+    for hit in _METADATA_KEY_RE.finditer(buffer, start, end):
+        newline = buffer.rfind(b"\n", start, hit.start())
+        line_start = newline + 1 if newline >= 0 else start
+        if line_start == last_line_start:
+            continue
+        last_line_start = line_start
+        line_end = buffer.find(b"\n", hit.end(), end)
+        if line_end < 0:
+            line_end = end
+        raw = buffer[line_start:line_end].lstrip()
+        if not raw.startswith(b";"):
+            continue
+        body = raw[1:].strip().decode("utf-8", "ignore")
+        _apply_comment_line(body, result)
+        if result.get("material") and result.get("print_time"):
+            return
+
+
+def _apply_comment_line(body: str, result: Dict[str, str]) -> None:
+    if "print_time" not in result:
+        if body[:1] in ("T", "t") and body[:5].upper() == "TIME:":
+            value = body[5:].strip()
+            try:
+                seconds = int(float(value))
+            except ValueError:
+                seconds = None
+            if seconds is not None:
+                result["print_time"] = _format_duration_from_seconds(seconds)
+                return
+        prusa_match = _PRUSA_TIME_RE.search(body)
+        if prusa_match:
+            duration = prusa_match.group(1).strip()
+            result["print_time"] = _parse_duration(duration) or duration
+            return
+
+    if "material" not in result:
+        for pattern in _MATERIAL_RES:
+            mat_match = pattern.search(body)
+            if not mat_match:
+                continue
+            material = mat_match.group(1).strip().strip('"')
+            if material:
+                result["material"] = material
+                break
+
+    if "colour" not in result:
+        for pattern in _COLOUR_RES:
+            col_match = pattern.search(body)
+            if not col_match:
+                continue
+            colour_value = col_match.group(1).strip().strip('"')
+            if colour_value:
+                result["colour"] = colour_value
+                break
 
 
 def extract_metadata_from_gcode(path: str, *, max_lines: int | None = None) -> Dict[str, str]:
     """Inspect a G-code file for material/time metadata.
 
-    If ``max_lines`` is provided and greater than zero, scanning stops once the
-    limit is reached; otherwise the entire file is streamed until the required
+    The file is memory-mapped and searched for annotation keywords in one pass;
+    only the comment lines that contain a keyword are decoded. If
+    ``max_lines`` is provided and greater than zero, scanning stops once the
+    limit is reached; otherwise the slicer header and trailing config block
+    are searched (the whole file when it is small) until the required
     metadata is collected.
     """
     result: Dict[str, str] = {}
     if not path or not os.path.isfile(path):
         return result
 
-    # Precompile regexes for common slicer annotations.
-    material_patterns = [
-        re.compile(r"filament_settings_id\s*=\s*\"?([^\";]+)\"?", re.IGNORECASE),
-        re.compile(r"filament_spool_name\s*=\s*\"?([^\";]+)\"?", re.IGNORECASE),
-        re.compile(r"filament_brand\s*=\s*\"?([^\";]+)\"?", re.IGNORECASE),
-        re.compile(r"filament_type\s*=\s*\"?([^\";]+)\"?", re.IGNORECASE),
-    ]
-    colour_patterns = [
-        re.compile(r"filament_colou?r\s*=\s*\"?([^\";]+)\"?", re.IGNORECASE),
-    ]
-    prusa_time_pattern = re.compile(r"estimated printing time.*=\s*([0-9hms ]+)", re.IGNORECASE)
-
     try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as handle:
-            limit = max_lines if (isinstance(max_lines, int) and max_lines > 0) else None
-            for line_number, line in enumerate(handle, 1):
-                if limit is not None and line_number > limit:
-                    break
-                stripped = line.strip()
-                if not stripped or not stripped.startswith(";"):
-                    continue
-                body = stripped[1:].strip()
-                upper_body = body.upper()
-
-                if "print_time" not in result:
-                    if upper_body.startswith("TIME:"):
-                        value = body[5:].strip()
-                        try:
-                            seconds = int(float(value))
-                        except ValueError:
-                            seconds = None
-                        if seconds is not None:
-                            result["print_time"] = _format_duration_from_seconds(seconds)
-                            continue
-                    prusa_match = prusa_time_pattern.search(body)
-                    if prusa_match:
-                        duration = prusa_match.group(1).strip()
-                        matches = re.findall(r"(\d+)\s*([hms])", duration, flags=re.IGNORECASE)
-                        if matches:
-                            tokens = [(int(amount), unit.lower()) for amount, unit in matches]
-                            result["print_time"] = _normalize_duration_tokens(tokens)
-                        else:
-                            result["print_time"] = duration
-                        continue
-
-                if "material" not in result:
-                    for pattern in material_patterns:
-                        mat_match = pattern.search(body)
-                        if not mat_match:
-                            continue
-                        material = mat_match.group(1).strip().strip('"')
-                        if material:
-                            result["material"] = material
-                            break
-
-                if "colour" not in result:
-                    for pattern in colour_patterns:
-                        col_match = pattern.search(body)
-                        if not col_match:
-                            continue
-                        colour_value = col_match.group(1).strip().strip('"')
-                        if colour_value:
-                            result["colour"] = colour_value
-                            break
-
-                if result.get("material") and result.get("print_time"):
-                    break
+        with open(path, "rb") as handle:
+            try:
+                buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files cannot be mapped
+                return result
+            with buffer:
+                for start, end in _scan_ranges(buffer, max_lines):
+                    _scan_range(buffer, start, end, result)
+                    if result.get("material") and result.get("print_time"):
+                        break
     except Exception:
         return result
 
@@ -138,7 +207,7 @@ def extract_metadata_from_gcode(path: str, *, max_lines: int | None = None) -> D
 
     if fallback_colour:
         existing = result.get("colour")
-        if not existing or re.fullmatch(r"#?[0-9a-fA-F]{6}", existing.replace("0x", "").strip("#")):
+        if not existing or _HEX_COLOUR_RE.fullmatch(existing.replace("0x", "").strip("#")):
             result["colour"] = fallback_colour
 
     chosen_colour = result.get("colour") or ""
@@ -148,9 +217,8 @@ def extract_metadata_from_gcode(path: str, *, max_lines: int | None = None) -> D
         material_value = result["material"].strip()
         if stripped_colour and lower_colour in material_value.lower():
             cleaned = material_value
-            pattern = re.compile(rf"\s*{re.escape(stripped_colour)}\b", re.IGNORECASE)
-            cleaned = pattern.sub("", cleaned)
-            cleaned = re.sub(r"\s+", " ", cleaned).strip()
+            cleaned = _colour_strip_re(stripped_colour).sub("", cleaned)
+            cleaned = _WS_RE.sub(" ", cleaned).strip()
             if cleaned:
                 result["material"] = cleaned
 
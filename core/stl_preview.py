@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -23,50 +29,181 @@ def render_stl_preview(
 	size: QSize | tuple[int, int] = QSize(320, 240),
 	*,
 	dark_theme: bool = False,
-	mesh: trimesh.Trimesh | None = None,
+	mesh: trimesh.Trimesh | _FastMesh | None = None,
 	view_angles: tuple[float, float] | None = None,
 	distance_scale: float = 1.0,
 	quality_scale: float = 1.0,
 ) -> QPixmap | None:
 	"""Render an STL or 3MF file into a tinted `QPixmap` for gallery previews.
 
-	The mesh is loaded with `trimesh`, plotted with Matplotlib's 3D toolkit,
-	and rasterised off-screen so PySide can display it without an OpenGL
-	widget. Returns `None` if the model cannot be parsed or rendered. The
-	`quality_scale` argument allows callers to trade detail for speed during
-	interactive updates (valid range 0.3-1.0).
+	Binary STLs are parsed directly into a triangle array; other formats are
+	loaded with `trimesh`. The mesh is rasterised off-screen with ModernGL when
+	a headless GL context is available, otherwise plotted with Matplotlib's 3D
+	toolkit, so PySide can display it without an OpenGL widget. Returns `None`
+	if the model cannot be parsed or rendered. The `quality_scale` argument
+	allows callers to trade detail for speed during interactive updates (valid
+	range 0.3-1.0).
+
+	Previews rendered from a file path are cached on disk as PNGs keyed by the
+	file's size and modification time plus the render options and renderer,
+	so unchanged models skip loading and rasterisation entirely.
 	"""
 
 	target_size = _coerce_qsize(size)
+	cache_path = None
+	backend = "moderngl" if _gl_state() is not None else "matplotlib"
+	if mesh is None and mesh_path:
+		cache_path = _preview_cache_path(
+			mesh_path,
+			target_size,
+			backend=backend,
+			dark_theme=dark_theme,
+			view_angles=view_angles,
+			distance_scale=distance_scale,
+			quality_scale=quality_scale,
+		)
+		if cache_path is not None and cache_path.is_file():
+			cached = QPixmap(str(cache_path))
+			if not cached.isNull():
+				_touch_cached_preview(cache_path)
+				return cached
+
+	pixmap, renderer = _render_preview(
+		mesh_path,
+		target_size,
+		dark_theme=dark_theme,
+		mesh=mesh,
+		view_angles=view_angles,
+		distance_scale=distance_scale,
+		quality_scale=quality_scale,
+	)
+	# a Matplotlib fallback must not be served later as a ModernGL preview
+	if pixmap is not None and cache_path is not None and renderer in (backend, "embedded"):
+		_store_cached_preview(cache_path, pixmap)
+	return pixmap
+
+
+def _render_preview(
+	mesh_path: str | Path | None,
+	target_size: QSize,
+	*,
+	dark_theme: bool,
+	mesh: trimesh.Trimesh | _FastMesh | None,
+	view_angles: tuple[float, float] | None,
+	distance_scale: float,
+	quality_scale: float,
+) -> tuple[QPixmap | None, str | None]:
+	"""Render the preview and report what produced it.
+
+	The second item is "embedded", "moderngl" or "matplotlib", or `None` when
+	nothing was rendered.
+	"""
 	background, face_color, edge_color = _palette(dark_theme)
 
 	if mesh is None:
 		if not mesh_path:
-			return None
-		mesh = _load_mesh(mesh_path)
-		if (mesh is None or mesh.is_empty) and str(mesh_path).lower().endswith(".3mf"):
+			return None, None
+		# slicer-embedded thumbnails are a small zip read; parsing the 3MF
+		# geometry is only worth it when none exists or a custom view is wanted
+		if view_angles is None and str(mesh_path).lower().endswith(".3mf"):
 			embedded = _extract_3mf_thumbnail(mesh_path, target_size, background)
 			if embedded is not None:
-				return embedded
+				return embedded, "embedded"
+		mesh = _load_mesh(mesh_path)
 	if mesh is None or mesh.is_empty:
-		return None
+		return None, None
 
 	quality_scale = float(np.clip(quality_scale, 0.3, 1.0))
 	width = max(64, int(target_size.width() * quality_scale))
 	height = max(64, int(target_size.height() * quality_scale))
 	dpi = int(70 + 30 * quality_scale)
 
-	figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
-	figure.patch.set_facecolor(background)
-	canvas = FigureCanvas(figure)
+	renderer = "moderngl"
+	image = _render_via_moderngl(
+		mesh,
+		width,
+		height,
+		face_color,
+		background,
+		view_angles=view_angles,
+		distance_scale=distance_scale,
+	)
+	if image is None:
+		renderer = "matplotlib"
+		image = _render_via_matplotlib(
+			mesh,
+			width,
+			height,
+			dpi,
+			face_color,
+			edge_color,
+			background,
+			view_angles=view_angles,
+			distance_scale=distance_scale,
+		)
+	if image is None or image.size == 0:
+		return None, None
 
-	axis = figure.add_subplot(111, projection="3d")
+	height_px, width_px, _ = image.shape
+	qimage = QImage(image.data, width_px, height_px, width_px * 4, QImage.Format_RGBA8888)
+	# fromImage copies the pixels, so the QImage can borrow the render buffer
+	pixmap = QPixmap.fromImage(qimage)
+	if pixmap.isNull():
+		return None, None
+	return _composite_pixmap(pixmap, target_size, background), renderer
+
+
+_MPL_SURFACE_LIMIT = 4
+_mpl_surfaces = threading.local()
+
+
+def _matplotlib_surface(width: int, height: int, dpi: int) -> tuple[Figure, FigureCanvas, object]:
+	"""Return a cleared (figure, canvas, 3D axis) for this size, reused per thread.
+
+	Building a Figure and Axes3D costs far more than drawing a small mesh, so
+	a few recently used surfaces are kept per thread and cleared between renders.
+	"""
+	surfaces = getattr(_mpl_surfaces, "cache", None)
+	if surfaces is None:
+		surfaces = OrderedDict()
+		_mpl_surfaces.cache = surfaces
+	key = (width, height, dpi)
+	surface = surfaces.pop(key, None)
+	if surface is None:
+		figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+		canvas = FigureCanvas(figure)
+		axis = figure.add_subplot(111, projection="3d")
+		surface = (figure, canvas, axis)
+	else:
+		surface[2].clear()
+	surfaces[key] = surface
+	while len(surfaces) > _MPL_SURFACE_LIMIT:
+		surfaces.popitem(last=False)
+	return surface
+
+
+def _render_via_matplotlib(
+	mesh: trimesh.Trimesh | _FastMesh,
+	width: int,
+	height: int,
+	dpi: int,
+	face_color: tuple[float, float, float, float],
+	edge_color: tuple[float, float, float, float],
+	background: str,
+	*,
+	view_angles: tuple[float, float] | None,
+	distance_scale: float,
+) -> np.ndarray | None:
+	figure, canvas, axis = _matplotlib_surface(width, height, dpi)
+	figure.patch.set_facecolor(background)
 	axis.set_facecolor(background)
 	axis.set_axis_off()
 	axis.set_position([0.0, 0.0, 1.0, 1.0])
 
 	triangles = mesh.triangles
 	if isinstance(triangles, np.ndarray) and triangles.size:
+		triangles = _downsample_triangles(triangles, width * height)
+		triangles = np.ascontiguousarray(triangles, dtype=np.float32)
 		collection = Poly3DCollection(
 			triangles,
 			linewidths=0.1,
@@ -79,20 +216,345 @@ def render_stl_preview(
 	_configure_view(axis, mesh, view_angles=view_angles, distance_scale=distance_scale)
 
 	canvas.draw()
-	image = np.asarray(canvas.buffer_rgba()).copy()
-	if image.size == 0:
+	# a view of the Agg renderer's buffer; the caller copies it once into a QPixmap
+	return np.asarray(canvas.buffer_rgba())
+
+
+_GL_VERTEX_SHADER = """
+#version 330
+uniform mat4 mvp;
+in vec3 in_pos;
+in vec3 in_normal;
+out vec3 v_normal;
+void main() {
+	gl_Position = mvp * vec4(in_pos, 1.0);
+	v_normal = in_normal;
+}
+"""
+
+_GL_FRAGMENT_SHADER = """
+#version 330
+uniform vec4 face_color;
+uniform vec3 light_dir;
+in vec3 v_normal;
+out vec4 f_color;
+void main() {
+	float diffuse = abs(dot(normalize(v_normal), light_dir));
+	f_color = vec4(face_color.rgb * (0.35 + 0.65 * diffuse), 1.0);
+}
+"""
+
+# Process-wide offscreen GL state: None until first use, False when unavailable.
+# A GL context is bound to the thread that created it, so the state records that
+# thread and every other thread falls back to Matplotlib.
+_GL_STATE: dict | bool | None = None
+_GL_LOCK = threading.Lock()
+
+
+def _gl_state() -> dict | None:
+	with _GL_LOCK:
+		state = _create_gl_state() if _GL_STATE is None else _GL_STATE
+	if not state or state["thread"] != threading.get_ident():
 		return None
+	return state
 
-	height_px, width_px, _ = image.shape
-	qimage = QImage(image.data, width_px, height_px, width_px * 4, QImage.Format_RGBA8888)
-	# copy to detach from numpy buffer before returning
-	pixmap = QPixmap.fromImage(qimage.copy())
-	if pixmap.isNull():
+
+def _create_gl_state() -> dict | bool:
+	global _GL_STATE
+	_GL_STATE = False
+	try:
+		import moderngl  # type: ignore
+	except Exception:
+		return False
+	context = None
+	for backend in ("egl", None):
+		try:
+			if backend:
+				context = moderngl.create_standalone_context(backend=backend)
+			else:
+				context = moderngl.create_standalone_context()
+			break
+		except Exception:
+			context = None
+	if context is None:
+		return False
+	try:
+		program = context.program(vertex_shader=_GL_VERTEX_SHADER, fragment_shader=_GL_FRAGMENT_SHADER)
+	except Exception:
+		return False
+	_GL_STATE = {
+		"module": moderngl,
+		"context": context,
+		"program": program,
+		"thread": threading.get_ident(),
+	}
+	return _GL_STATE
+
+
+def _render_via_moderngl(
+	mesh: trimesh.Trimesh | _FastMesh,
+	width: int,
+	height: int,
+	face_color: tuple[float, float, float, float],
+	background: str,
+	*,
+	view_angles: tuple[float, float] | None,
+	distance_scale: float,
+) -> np.ndarray | None:
+	"""Rasterise the mesh on the GPU through a headless ModernGL context.
+
+	Returns an RGBA array (top row first) or `None` when ModernGL or an
+	offscreen context is unavailable, or when called from a thread other than
+	the one that created the context, so callers can fall back to Matplotlib.
+	"""
+	state = _gl_state()
+	if state is None:
+		return None
+	triangles = mesh.triangles
+	bounds = mesh.bounds
+	if not isinstance(triangles, np.ndarray) or not triangles.size or bounds.size == 0:
+		return None
+
+	moderngl = state["module"]
+	context = state["context"]
+	program = state["program"]
+	framebuffer = vbo = vao = None
+	try:
+		tris = np.ascontiguousarray(triangles, dtype=np.float32).reshape(-1, 3, 3)
+		normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+		lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+		normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+		interleaved = np.empty((tris.shape[0], 3, 6), dtype=np.float32)
+		interleaved[:, :, :3] = tris
+		interleaved[:, :, 3:] = normals[:, None, :]
+
+		eye_dir, mvp = _view_matrix(bounds, width / height, view_angles, distance_scale)
+		program["mvp"].write(mvp.T.astype("f4").tobytes())
+		program["face_color"].value = tuple(float(c) for c in face_color)
+		program["light_dir"].value = tuple(float(c) for c in eye_dir)
+
+		framebuffer = context.framebuffer(
+			color_attachments=[context.renderbuffer((width, height), 4)],
+			depth_attachment=context.depth_renderbuffer((width, height)),
+		)
+		vbo = context.buffer(interleaved.tobytes())
+		vao = context.vertex_array(program, [(vbo, "3f 3f", "in_pos", "in_normal")])
+		framebuffer.use()
+		bg = _bg_qcolor(background)
+		framebuffer.clear(bg.redF(), bg.greenF(), bg.blueF(), 1.0)
+		context.enable(moderngl.DEPTH_TEST)
+		vao.render(moderngl.TRIANGLES)
+		raw = framebuffer.read(components=4, alignment=1)
+	except Exception:
+		return None
+	finally:
+		for resource in (vao, vbo, framebuffer):
+			if resource is not None:
+				try:
+					resource.release()
+				except Exception:
+					pass
+	# the projection flips Y, so rows already come back top-first
+	return np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 4)
+
+
+def _view_matrix(
+	bounds: np.ndarray,
+	aspect: float,
+	view_angles: tuple[float, float] | None,
+	distance_scale: float,
+) -> tuple[np.ndarray, np.ndarray]:
+	"""Build an orthographic view-projection matching `_configure_view`'s framing."""
+	if view_angles is None:
+		elev, azim = 26, 35
+	else:
+		elev, azim = view_angles
+	elev_rad = np.radians(float(elev))
+	azim_rad = np.radians(float(azim))
+	eye_dir = np.array(
+		[np.cos(elev_rad) * np.cos(azim_rad), np.cos(elev_rad) * np.sin(azim_rad), np.sin(elev_rad)],
+		dtype=np.float64,
+	)
+
+	lower, upper = bounds
+	center = (lower + upper) / 2.0
+	radius = float(np.linalg.norm((upper - lower) / 2.0)) or 1.0
+	half = radius * 1.05 * max(0.2, float(distance_scale))
+
+	forward = -eye_dir
+	world_up = np.array([0.0, 0.0, 1.0])
+	right = np.cross(forward, world_up)
+	if np.linalg.norm(right) < 1e-6:
+		right = np.array([1.0, 0.0, 0.0])
+	right /= np.linalg.norm(right)
+	up = np.cross(right, forward)
+
+	view = np.identity(4)
+	view[0, :3] = right
+	view[1, :3] = up
+	view[2, :3] = -forward
+	view[:3, 3] = -view[:3, :3] @ (center + eye_dir * radius * 2.0)
+
+	half_w = half * max(1.0, aspect)
+	half_h = half * max(1.0, 1.0 / aspect)
+	near, far = 0.01 * radius, radius * 4.0
+	projection = np.identity(4)
+	projection[0, 0] = 1.0 / half_w
+	# negative Y scale renders upside down so glReadPixels yields top-first rows
+	projection[1, 1] = -1.0 / half_h
+	projection[2, 2] = -2.0 / (far - near)
+	projection[2, 3] = -(far + near) / (far - near)
+	return eye_dir, projection @ view
+
+
+_PREVIEW_CACHE_VERSION = 1
+_PREVIEW_CACHE_MAX_ENTRIES = 1000
+_PREVIEW_CACHE_EVICT_INTERVAL = 100
+_preview_cache_inserts = 0
+_preview_cache_lock = threading.Lock()
+
+
+def _preview_cache_dir() -> Path:
+	if os.name == "nt":
+		base = os.getenv("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+		return Path(base) / "zPrint" / "cache" / "stl_previews"
+	base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+	return Path(base) / "zprint" / "stl_previews"
+
+
+def _preview_cache_path(
+	mesh_path: str | Path,
+	target_size: QSize,
+	*,
+	backend: str,
+	dark_theme: bool,
+	view_angles: tuple[float, float] | None,
+	distance_scale: float,
+	quality_scale: float,
+) -> Path | None:
+	try:
+		resolved = os.path.abspath(str(mesh_path))
+		stat = os.stat(resolved)
+	except OSError:
 		return None
-	return _composite_pixmap(pixmap, target_size, background)
+	key = repr((
+		_PREVIEW_CACHE_VERSION,
+		os.path.normcase(resolved),
+		stat.st_mtime_ns,
+		stat.st_size,
+		backend,
+		bool(dark_theme),
+		target_size.width(),
+		target_size.height(),
+		tuple(float(angle) for angle in view_angles) if view_angles is not None else None,
+		round(float(distance_scale), 4),
+		round(float(quality_scale), 4),
+	))
+	digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+	return _preview_cache_dir() / f"{digest}.png"
+
+
+def _store_cached_preview(cache_path: Path, pixmap: QPixmap) -> None:
+	global _preview_cache_inserts
+	temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+	try:
+		cache_path.parent.mkdir(parents=True, exist_ok=True)
+		if not pixmap.save(str(temp_path), "PNG"):
+			return
+		os.replace(temp_path, cache_path)
+	except Exception:
+		try:
+			temp_path.unlink()
+		except Exception:
+			pass
+		return
+	with _preview_cache_lock:
+		_preview_cache_inserts += 1
+		evict = _preview_cache_inserts % _PREVIEW_CACHE_EVICT_INTERVAL == 0
+	if evict:
+		_evict_preview_cache(cache_path.parent)
+
+
+def _touch_cached_preview(cache_path: Path) -> None:
+	# hits refresh the mtime so eviction drops the least recently used entries
+	try:
+		os.utime(cache_path)
+	except OSError:
+		pass
+
+
+def _evict_preview_cache(cache_dir: Path) -> None:
+	try:
+		entries = [(entry.stat().st_mtime, entry) for entry in cache_dir.glob("*.png")]
+	except Exception:
+		return
+	excess = len(entries) - _PREVIEW_CACHE_MAX_ENTRIES
+	if excess <= 0:
+		return
+	entries.sort(key=lambda item: item[0])
+	for _, entry in entries[:excess]:
+		try:
+			entry.unlink()
+		except Exception:
+			pass
+
+
+_BINARY_STL_DTYPE = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")])
+
+
+class _FastMesh:
+	"""Minimal read-only stand-in for `trimesh.Trimesh` used by the preview renderer.
+
+	Only exposes the attributes `render_stl_preview` needs (`triangles`,
+	`bounds`, `is_empty`) so binary STLs can skip trimesh's processing.
+	"""
+
+	__slots__ = ("triangles", "bounds", "is_empty", "_preview_view")
+
+	def __init__(self, triangles: np.ndarray):
+		self.triangles = triangles
+		self.is_empty = triangles.shape[0] == 0
+		if self.is_empty:
+			self.bounds = np.zeros((0, 3), dtype=np.float32)
+		else:
+			points = triangles.reshape(-1, 3)
+			self.bounds = np.stack([points.min(axis=0), points.max(axis=0)])
+
+
+def _fast_load_binary_stl(mesh_path: str | Path) -> _FastMesh | None:
+	"""Parse a binary STL straight into a triangle array, or return `None`.
+
+	Binary files are recognised by their size (84-byte header plus 50 bytes
+	per facet) rather than the leading "solid" keyword, which some exporters
+	also write into binary headers.
+	"""
+	path = Path(mesh_path)
+	if path.suffix.lower() != ".stl":
+		return None
+	try:
+		with path.open("rb") as handle:
+			header = handle.read(84)
+			if len(header) < 84:
+				return None
+			(tri_count,) = struct.unpack_from("<I", header, 80)
+			if path.stat().st_size != 84 + 50 * tri_count:
+				return None
+			records = np.fromfile(handle, dtype=_BINARY_STL_DTYPE, count=tri_count)
+	except Exception:
+		return None
+	if records.shape[0] != tri_count:
+		return None
+	triangles = np.ascontiguousarray(records["vertices"], dtype=np.float32)
+	if not np.isfinite(triangles).all():
+		return None
+	return _FastMesh(triangles)
+
 
+def _load_mesh(mesh_path: str | Path) -> trimesh.Trimesh | _FastMesh | None:
+	fast = _fast_load_binary_stl(mesh_path)
+	if fast is not None:
+		return fast
 
-def _load_mesh(mesh_path: str | Path) -> trimesh.Trimesh | None:
 	try:
 		loaded = trimesh.load_mesh(mesh_path, force="mesh", process=True)
 	except ModuleNotFoundError as exc:
@@ -119,6 +581,20 @@ def _load_mesh(mesh_path: str | Path) -> trimesh.Trimesh | None:
 	return None
 
 
+def _downsample_triangles(triangles: np.ndarray, pixel_count: int) -> np.ndarray:
+	"""Drop triangles that cannot be resolved at the preview resolution.
+
+	Uses a seeded random subset so repeated renders of the same mesh match.
+	"""
+	count = triangles.shape[0]
+	target = max(8000, int(pixel_count) // 6)
+	if count <= target:
+		return triangles
+	indices = np.random.default_rng(0).choice(count, target, replace=False)
+	indices.sort()
+	return triangles[indices]
+
+
 def _coerce_qsize(value: QSize | tuple[int, int]) -> QSize:
 	if isinstance(value, QSize):
 		return value
@@ -130,7 +606,7 @@ def _composite_pixmap(pixmap: QPixmap, target_size: QSize, background: str) -> Q
 	if pixmap.isNull():
 		return None
 	result = QPixmap(target_size)
-	result.fill(QColor(background))
+	result.fill(_bg_qcolor(background))
 	scaled = pixmap.scaled(
 		target_size,
 		aspectMode=Qt.KeepAspectRatio,
@@ -146,28 +622,28 @@ def _composite_pixmap(pixmap: QPixmap, target_size: QSize, background: str) -> Q
 
 def _extract_3mf_thumbnail(mesh_path: str | Path, target_size: QSize, background: str) -> QPixmap | None:
 	try:
-		with ZipFile(mesh_path) as archive:
-			names = archive.namelist()
-			candidates = [
-				name for name in names
-				if name.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif"))
-				and ("thumbnail" in name.lower() or "preview" in name.lower())
-			]
-			if not candidates:
-				return None
-
-			def _score(name: str) -> tuple[int, int]:
-				lower = name.lower()
+		with ZipFile(mesh_path, "r") as archive:
+			scored = []
+			for info in archive.infolist():
+				lower = info.filename.lower()
+				if not lower.endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif")):
+					continue
 				primary = 0
 				if "thumbnail" in lower:
 					primary -= 100
 				if "preview" in lower:
 					primary -= 80
+				if not primary:
+					continue
 				if lower.endswith(".png"):
 					primary -= 5
-				return (primary, lower.count('/'))
+				# prefer the largest image among equally named candidates
+				scored.append(((primary, lower.count('/'), -info.file_size), info))
+			if not scored:
+				return None
+			scored.sort(key=lambda item: item[0])
 
-			for candidate in sorted(candidates, key=_score):
+			for _, candidate in scored:
 				try:
 					with archive.open(candidate) as fh:
 						data = fh.read()
@@ -187,6 +663,12 @@ def _extract_3mf_thumbnail(mesh_path: str | Path, target_size: QSize, background
 	return None
 
 
+@lru_cache(maxsize=4)
+def _bg_qcolor(background: str) -> QColor:
+	return QColor(background)
+
+
+@lru_cache(maxsize=4)
 def _palette(dark: bool) -> tuple[str, tuple[float, float, float, float], tuple[float, float, float, float]]:
 	if dark:
 		return (
@@ -201,9 +683,28 @@ def _palette(dark: bool) -> tuple[str, tuple[float, float, float, float], tuple[
 	)
 
 
+def _preview_view(mesh: trimesh.Trimesh | _FastMesh) -> tuple[np.ndarray, float] | None:
+	"""Return the (center, radius) framing for a mesh, cached on the mesh object."""
+	cached = getattr(mesh, "_preview_view", None)
+	if cached is not None:
+		return cached
+	bounds = mesh.bounds
+	if bounds is None or bounds.size == 0:
+		return None
+	bounds = bounds.astype(np.float32, copy=False)
+	lower, upper = bounds
+	center = 0.5 * (lower + upper)
+	radius = 0.6 * float(np.ptp(bounds, axis=0).max()) or 1.0
+	try:
+		mesh._preview_view = (center, radius)
+	except Exception:
+		pass
+	return center, radius
+
+
 def _configure_view(
 	axis,
-	mesh: trimesh.Trimesh,
+	mesh: trimesh.Trimesh | _FastMesh,
 	*,
 	view_angles: tuple[float, float] | None = None,
 	distance_scale: float = 1.0,
@@ -219,15 +720,10 @@ def _configure_view(
 	except Exception:
 		pass
 
-	bounds = mesh.bounds
-	if bounds.size == 0:
+	view = _preview_view(mesh)
+	if view is None:
 		return
-	lower, upper = bounds
-	extents = upper - lower
-	half_extents = extents / 2.0
-	max_half_extent = float(np.max(half_extents)) or 1.0
-	radius = max_half_extent * 1.2
-	center = (lower + upper) / 2.0
+	center, radius = view
 
 	for center_value, axis_setter in zip(center, (axis.set_xlim, axis.set_ylim, axis.set_zlim)):
 		axis_setter(center_value - radius, center_value + radius)
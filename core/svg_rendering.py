@@ -1,15 +1,45 @@
 from __future__ import annotations
 
+import os
+import re
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 
-from PySide6.QtCore import Qt, QSize, QByteArray
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor
+from PySide6.QtCore import Qt, QRectF, QSize, QByteArray, QFile, QIODevice
+from PySide6.QtGui import QIcon, QIconEngine, QImage, QPixmap, QPixmapCache, QPainter, QColor
 
 try:
     from PySide6.QtSvg import QSvgRenderer  # type: ignore
 except Exception:  # pragma: no cover - QtSvg might be missing
     QSvgRenderer = None
 
+try:
+    from fastnumbers import fast_float as _FAST_FLOAT  # type: ignore
+except Exception:  # pragma: no cover - fastnumbers is optional
+    _FAST_FLOAT = None
+
+try:
+    from lxml import etree as _LXML_ETREE  # type: ignore
+except Exception:  # pragma: no cover - lxml is optional
+    _LXML_ETREE = None
+
+if _LXML_ETREE is not None:
+    _LXML_PARSER = _LXML_ETREE.XMLParser(resolve_entities=False, no_network=True)
+
+    def _parse_svg(raw: bytes):
+        return _LXML_ETREE.fromstring(raw, _LXML_PARSER)
+
+    def _svg_tostring(root) -> bytes:
+        return _LXML_ETREE.tostring(root, encoding='utf-8')
+else:
+    def _parse_svg(raw: bytes):
+        return ET.fromstring(raw)
+
+    def _svg_tostring(root) -> bytes:
+        return ET.tostring(root, encoding='utf-8')
+
 
 def tint_icon(path: str, hex_color: str, size: QSize | None = None) -> QIcon:
     """Render an icon tinted to the requested color.
@@ -17,31 +47,164 @@ def tint_icon(path: str, hex_color: str, size: QSize | None = None) -> QIcon:
     Prefers high-fidelity SVG rendering via QSvgRenderer when available and
     applies a heuristic cleanup to strip full-canvas background rectangles so
     theme tinting works reliably. Falls back to standard QIcon painting when
-    QtSvg support is unavailable or the file is not an SVG.
+    QtSvg support is unavailable or the file is not an SVG. Results are cached
+    per (path, modification time, color, size).
+    """
+    try:
+        key = _tint_key(path, hex_color, size)
+        icon = _TINTED_ICON_CACHE.get(key)
+        if icon is not None:
+            _TINTED_ICON_CACHE.move_to_end(key)
+            return icon
+        icon = _render_tinted_icon(*key)
+        _remember_tinted_icon(key, icon)
+        return icon
+    except Exception:
+        return QIcon()
+
+
+class TintedSvgIconEngine(QIconEngine):
+    """Icon engine that tints ``path`` lazily, at exactly the size Qt paints it.
+
+    Nothing is rasterised until a widget first asks for a pixmap; each
+    (size, mode, state) result is then kept in QPixmapCache, so repaints are a
+    cache lookup bounded by Qt's cache limit and high-DPI screens get a pixmap
+    rendered at device size.
+    """
+
+    def __init__(self, path: str, hex_color: str):
+        super().__init__()
+        self._path = path
+        self._hex_color = hex_color
+        self._cache_prefix = f'zprint:tint:{path}:{hex_color}'
+
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def scaledPixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State, scale: float) -> QPixmap:
+        width = max(1, round(size.width() * scale))
+        height = max(1, round(size.height() * scale))
+        key = f'{self._cache_prefix}:{width}x{height}:{mode.value}:{state.value}'
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            device_size = QSize(width, height)
+            # the plain tinted icon supplies Qt's generated disabled/selected variants
+            pixmap = tint_icon(self._path, self._hex_color, device_size).pixmap(device_size, mode, state)
+            QPixmapCache.insert(key, pixmap)
+        if scale != 1.0:
+            pixmap = QPixmap(pixmap)
+            pixmap.setDevicePixelRatio(scale)
+        return pixmap
+
+    def paint(self, painter: QPainter, rect, mode: QIcon.Mode, state: QIcon.State) -> None:
+        device = painter.device()
+        scale = device.devicePixelRatioF() if device is not None else 1.0
+        painter.drawPixmap(rect, self.scaledPixmap(rect.size(), mode, state, scale))
+
+    def actualSize(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QSize:
+        return QSize(size)
+
+    def isNull(self) -> bool:
+        # a missing or broken file would only ever paint blank pixmaps
+        return not self._path or not _is_renderable(self._path)
+
+    def key(self) -> str:
+        return 'TintedSvgIconEngine'
+
+    def clone(self) -> 'TintedSvgIconEngine':
+        return TintedSvgIconEngine(self._path, self._hex_color)
+
+
+def prerender_tinted_icons(requests: Iterable[tuple[str, str, QSize | None]]) -> None:
+    """Tint a batch of SVG icons on worker threads and cache the results.
+
+    Each request is a ``(path, hex_color, size)`` triple as accepted by
+    :func:`tint_icon`; later ``tint_icon`` calls for the same triples are
+    served from the cache. Rendering targets QImage, which unlike QPixmap may
+    be painted outside the GUI thread, so only the final QPixmap conversion
+    happens on the calling thread. Must be called from the GUI thread.
     """
+    if QSvgRenderer is None:
+        return
+    pending: dict[tuple[str, int, str, int, int], bytes] = {}
+    for path, hex_color, size in requests:
+        try:
+            key = _tint_key(path, hex_color, size)
+        except Exception:
+            continue
+        if key in _TINTED_ICON_CACHE or key in pending or key[1] < 0 or not key[0].lower().endswith('.svg'):
+            continue
+        source = _svg_source_bytes(key[:2])
+        if source is not None:
+            pending[key] = source
+    if len(pending) < _PARALLEL_TINT_MIN:
+        # not worth a pool; tint_icon renders these lazily on first use
+        return
+    workers = min(len(pending), os.cpu_count() or 1, _PARALLEL_TINT_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        images = list(pool.map(_tint_svg_bytes, pending.values(), pending.keys()))
+    for key, image in zip(pending.keys(), images):
+        if image is not None:
+            _remember_tinted_icon(key, QIcon(QPixmap.fromImage(image)))
+
+
+_TINTED_ICON_CACHE_SIZE = 256
+_TINTED_ICON_CACHE: OrderedDict[tuple[str, int, str, int, int], QIcon] = OrderedDict()
+
+_PARALLEL_TINT_MIN = 4
+_PARALLEL_TINT_MAX_WORKERS = 8
+
+
+def _tint_key(path: str, hex_color: str, size: QSize | None) -> tuple[str, int, str, int, int]:
+    # mtime only takes part in the cache key so edited files are re-rendered
+    if size is None:
+        size = QSize(64, 64)
+    width = max(1, size.width())
+    height = max(1, size.height())
     try:
-        if size is None:
-            size = QSize(64, 64)
-        width = max(1, size.width())
-        height = max(1, size.height())
+        mtime = _source_mtime(path)
+    except OSError:
+        mtime = -1
+    if not _is_resource(path):
+        path = os.path.abspath(path)
+    return (path, mtime, hex_color, width, height)
+
+
+def _is_resource(path: str) -> bool:
+    return path.startswith(':')
+
+
+def _source_mtime(path: str) -> int:
+    # compiled Qt resources (':/...') ship inside the binary and never change
+    if _is_resource(path):
+        return 0
+    return os.stat(path).st_mtime_ns
 
+
+def _read_source(path: str) -> bytes:
+    if _is_resource(path):
+        handle = QFile(path)
+        if not handle.open(QIODevice.ReadOnly):
+            raise OSError(f'Unable to open resource {path}')
+        try:
+            return bytes(handle.readAll())
+        finally:
+            handle.close()
+    with open(path, 'rb') as handle:
+        return handle.read()
+
+
+def _remember_tinted_icon(key: tuple[str, int, str, int, int], icon: QIcon) -> None:
+    _TINTED_ICON_CACHE[key] = icon
+    if len(_TINTED_ICON_CACHE) > _TINTED_ICON_CACHE_SIZE:
+        _TINTED_ICON_CACHE.popitem(last=False)
+
+
+def _render_tinted_icon(path: str, mtime: int, hex_color: str, width: int, height: int) -> QIcon:
+    try:
         renderer = _create_svg_renderer(path) if path.lower().endswith('.svg') else None
         if renderer is not None and renderer.isValid():
-            base_pixmap = QPixmap(width, height)
-            base_pixmap.fill(Qt.transparent)
-
-            painter = QPainter(base_pixmap)
-            renderer.render(painter)
-            painter.end()
-
-            tinted = QPixmap(width, height)
-            tinted.fill(Qt.transparent)
-            painter = QPainter(tinted)
-            painter.fillRect(0, 0, width, height, QColor(hex_color))
-            painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
-            painter.drawPixmap(0, 0, base_pixmap)
-            painter.end()
-            return QIcon(tinted)
+            return QIcon(QPixmap.fromImage(_tint_svg_image(renderer, hex_color, width, height)))
 
         fallback = QIcon(path)
         if fallback.isNull():
@@ -58,91 +221,234 @@ def tint_icon(path: str, hex_color: str, size: QSize | None = None) -> QIcon:
         return QIcon()
 
 
+def _is_renderable(path: str) -> bool:
+    """Whether ``_render_tinted_icon`` can draw ``path``; the SVG renderer is cached."""
+    try:
+        if path.lower().endswith('.svg'):
+            renderer = _create_svg_renderer(path)
+            if renderer is not None and renderer.isValid():
+                return True
+        return not QIcon(path).isNull()
+    except Exception:
+        return False
+
+
+def _tint_svg_image(renderer, hex_color: str, width: int, height: int) -> QImage:
+    # premultiplied ARGB is the raster pixmap format, so QPixmap.fromImage adopts this
+    # buffer through implicit sharing instead of converting it; a pooled image would be
+    # detached (reallocated) on its next fill anyway, so each call owns a fresh one
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    # one cached renderer serves every size; the target rect does the scaling
+    renderer.render(painter, QRectF(0, 0, width, height))
+    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+    painter.fillRect(0, 0, width, height, QColor(hex_color))
+    painter.end()
+    return image
+
+
+def _tint_svg_bytes(source: bytes, key: tuple[str, int, str, int, int]) -> QImage | None:
+    # runs on a worker thread: uses a private renderer rather than the shared cache
+    try:
+        renderer = QSvgRenderer(QByteArray(source))
+        if not renderer.isValid():
+            return None
+        return _tint_svg_image(renderer, key[2], key[3], key[4])
+    except Exception:
+        return None
+
+
+_RECT_TAGS = frozenset({'rect', '{http://www.w3.org/2000/svg}rect'})
+
+_NEEDS_XML = object()
+_RECT_OPEN_RE = re.compile(rb'<rect[\s/>]')
+_SELF_CLOSING_RECT_RE = re.compile(rb'<rect\s[^>]*/\s*>')
+_SVG_VIEW_BOX_RE = re.compile(rb'<svg\s[^>]*?\bviewBox\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_ATTR_RE = re.compile(rb'([\w:.-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+_CLEANED_SVG_CACHE_SIZE = 128
+_CLEANED_SVG_CACHE: OrderedDict[tuple[str, int], bytes | None] = OrderedDict()
+
+_SVG_RENDERER_CACHE_SIZE = 64
+_SVG_RENDERER_CACHE: OrderedDict[tuple[str, int], QSvgRenderer] = OrderedDict()
+
+
 def _create_svg_renderer(path: str):
     if QSvgRenderer is None:
         return None
     try:
-        with open(path, 'r', encoding='utf-8') as handle:
-            svg_text = handle.read()
+        key = (path, _source_mtime(path))
+    except OSError:
+        return None
+    renderer = _SVG_RENDERER_CACHE.get(key)
+    if renderer is not None:
+        _SVG_RENDERER_CACHE.move_to_end(key)
+        return renderer
+    cleaned = _cleaned_svg_bytes(key)
+    try:
+        if cleaned is not None:
+            renderer = QSvgRenderer(QByteArray(cleaned))
+        else:
+            renderer = QSvgRenderer(path)
     except Exception:
-        try:
-            return QSvgRenderer(path)
-        except Exception:
-            return None
+        return None
+    _SVG_RENDERER_CACHE[key] = renderer
+    if len(_SVG_RENDERER_CACHE) > _SVG_RENDERER_CACHE_SIZE:
+        _SVG_RENDERER_CACHE.popitem(last=False)
+    return renderer
+
+
+def _svg_source_bytes(key: tuple[str, int]) -> bytes | None:
+    """Return the bytes a renderer for ``key`` should load: cleaned if needed, else the file."""
+    cleaned = _cleaned_svg_bytes(key)
+    if cleaned is not None:
+        return cleaned
+    try:
+        return _read_source(key[0])
+    except OSError:
+        return None
+
+
+def _cleaned_svg_bytes(key: tuple[str, int]) -> bytes | None:
+    """Return the SVG with background rects stripped, or None to use the file as-is."""
+    try:
+        cleaned = _CLEANED_SVG_CACHE[key]
+    except KeyError:
+        pass
+    else:
+        _CLEANED_SVG_CACHE.move_to_end(key)
+        return cleaned
+    cleaned = _strip_background_rects(key[0])
+    _CLEANED_SVG_CACHE[key] = cleaned
+    if len(_CLEANED_SVG_CACHE) > _CLEANED_SVG_CACHE_SIZE:
+        _CLEANED_SVG_CACHE.popitem(last=False)
+    return cleaned
+
+
+def _to_float_attr(value: str) -> float | None:
+    value = value.strip()
+    if value.endswith('px'):
+        value = value[:-2]
+    if _FAST_FLOAT is not None:
+        return _FAST_FLOAT(value, default=None)
+    try:
+        return float(value)
+    except ValueError:
+        return None
 
+
+def _parse_view_box(view_box: str) -> tuple[float | None, float | None]:
     try:
-        root = ET.fromstring(svg_text)
+        _, _, vb_width, vb_height = map(float, view_box.replace(',', ' ').split())
+    except ValueError:
+        return None, None
+    return vb_width, vb_height
+
+
+def _is_background_rect(attrib, vb_width: float | None, vb_height: float | None) -> bool:
+    style = attrib.get('style', '')
+    fill = attrib.get('fill', '')
+    style_norm = style.replace(' ', '').lower()
+    has_fill = (
+        ('fill:' in style_norm and 'fill:none' not in style_norm)
+        or (fill and fill.lower() != 'none')
+    )
+    if not has_fill:
+        return False
+    width_s = attrib.get('width', '').strip()
+    height_s = attrib.get('height', '').strip()
+    is_percent_full = (
+        width_s[-1:] == '%'
+        and height_s[-1:] == '%'
+        and width_s.startswith('100')
+        and height_s.startswith('100')
+    )
+    if is_percent_full:
+        return True
+    if vb_width is None or vb_height is None:
+        return False
+    if _to_float_attr(width_s) != vb_width or _to_float_attr(height_s) != vb_height:
+        return False
+    x_num = _to_float_attr(attrib.get('x', '0')) or 0.0
+    y_num = _to_float_attr(attrib.get('y', '0')) or 0.0
+    return abs(x_num) < 1e-6 and abs(y_num) < 1e-6
+
+
+def _strip_background_rects(path: str) -> bytes | None:
+    try:
+        raw = _read_source(path)
     except Exception:
-        try:
-            return QSvgRenderer(path)
-        except Exception:
-            return None
+        return None
+    if b'<rect' not in raw and b':rect' not in raw:
+        return None
 
-    view_box = root.attrib.get('viewBox', '')
-    vb_width = vb_height = None
-    if view_box:
-        parts = [segment for segment in view_box.replace(',', ' ').split(' ') if segment.strip()]
-        if len(parts) == 4:
-            try:
-                vb_width = float(parts[2])
-                vb_height = float(parts[3])
-            except Exception:
-                vb_width = vb_height = None
+    cleaned = _strip_background_rects_fast(raw)
+    if cleaned is not _NEEDS_XML:
+        return cleaned
+
+    try:
+        root = _parse_svg(raw)
+    except Exception:
+        return None
+
+    vb_width, vb_height = _parse_view_box(root.attrib.get('viewBox', ''))
+
+    backgrounds = []
+    for parent in root.iter():
+        for element in parent:
+            if element.tag in _RECT_TAGS and _is_background_rect(element.attrib, vb_width, vb_height):
+                backgrounds.append((parent, element))
 
     removed_any = False
-    for parent in list(root.iter()):
-        for element in list(parent):
-            if not element.tag.lower().endswith('rect'):
-                continue
-            width_attr = element.attrib.get('width', '')
-            height_attr = element.attrib.get('height', '')
-            x_attr = element.attrib.get('x', '0')
-            y_attr = element.attrib.get('y', '0')
-            style = element.attrib.get('style', '')
-            fill = element.attrib.get('fill', '')
-
-            def _to_float(value: str):
-                try:
-                    return float(value.replace('px', ''))
-                except Exception:
-                    return None
-
-            is_percent_full = (
-                width_attr.strip().endswith('%')
-                and height_attr.strip().endswith('%')
-                and width_attr.strip().startswith('100')
-                and height_attr.strip().startswith('100')
-            )
-            width_num = _to_float(width_attr)
-            height_num = _to_float(height_attr)
-            x_num = _to_float(x_attr) or 0.0
-            y_num = _to_float(y_attr) or 0.0
-            matches_viewbox = (
-                vb_width is not None
-                and vb_height is not None
-                and width_num == vb_width
-                and height_num == vb_height
-                and abs(x_num) < 1e-6
-                and abs(y_num) < 1e-6
-            )
-            has_fill = (
-                ('fill:' in style and 'fill:none' not in style.replace(' ', '').lower())
-                or (fill and fill.lower() != 'none')
-            )
-            if has_fill and (is_percent_full or matches_viewbox):
-                try:
-                    parent.remove(element)
-                    removed_any = True
-                except Exception:
-                    continue
+    for parent, element in backgrounds:
+        try:
+            parent.remove(element)
+            removed_any = True
+        except Exception:
+            continue
 
     if removed_any:
         try:
-            cleaned = ET.tostring(root, encoding='utf-8')
-            return QSvgRenderer(QByteArray(cleaned))
+            return _svg_tostring(root)
         except Exception:
             pass
+    return None
+
+
+def _strip_background_rects_fast(raw: bytes):
+    """Splice background rects out of the raw bytes without building a tree.
+
+    Only handles the plain case of unprefixed, self-closing rects outside
+    comments and CDATA; anything else returns ``_NEEDS_XML`` so the caller
+    falls back to a real parse.
+    """
+    if b':rect' in raw or b'<!' in raw or b'&' in raw:
+        return _NEEDS_XML
+    matches = list(_SELF_CLOSING_RECT_RE.finditer(raw))
+    if len(matches) != len(_RECT_OPEN_RE.findall(raw)):
+        return _NEEDS_XML
     try:
-        return QSvgRenderer(path)
-    except Exception:
+        view_box_match = _SVG_VIEW_BOX_RE.search(raw)
+        vb_width = vb_height = None
+        if view_box_match is not None:
+            view_box = view_box_match.group(1) if view_box_match.group(1) is not None else view_box_match.group(2)
+            vb_width, vb_height = _parse_view_box(view_box.decode('utf-8'))
+        pieces = []
+        last = 0
+        for match in matches:
+            attrib = {
+                attr.group(1).decode('utf-8'): (
+                    attr.group(2) if attr.group(2) is not None else attr.group(3)
+                ).decode('utf-8')
+                for attr in _ATTR_RE.finditer(match.group())
+            }
+            if _is_background_rect(attrib, vb_width, vb_height):
+                pieces.append(raw[last:match.start()])
+                last = match.end()
+    except UnicodeDecodeError:
+        return _NEEDS_XML
+    if not pieces:
         return None
+    pieces.append(raw[last:])
+    return b''.join(pieces)
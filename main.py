@@ -3,8 +3,9 @@ import os
 import json
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import partial
+from functools import lru_cache, partial
 from typing import Callable
 from PySide6.QtWidgets import (
     QApplication,
@@ -24,14 +25,16 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QWidget,
     QProgressBar,
+    QScrollArea,
     QMenuBar,
     QTextBrowser,
 )
 from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QFile, Qt, QSize, QEvent, QTimer, QEventLoop
-from PySide6.QtGui import QAction, QIcon, QFont, QPixmap
+from PySide6.QtCore import QBuffer, QByteArray, QDir, QFile, QIODevice, QObject, Qt, QRect, QSize, QEvent, QTimer, QEventLoop
+from PySide6.QtGui import QAction, QIcon, QFont, QFontDatabase, QPixmap, QPixmapCache
+import shiboken6
 
-from core.svg_rendering import tint_icon
+from core.svg_rendering import TintedSvgIconEngine, prerender_tinted_icons
 from core.stl_preview import render_stl_preview
 from core.active_manager import ActiveModelError, set_model_active
 from ui.new_model_dialog import NewModelDialog
@@ -39,8 +42,123 @@ from ui.edit_model_dialog import EditModelDialog
 from ui.stl_preview_dialog import StlPreviewDialog
 from ui.welcome_dialog import WelcomeDialog
 
+try:
+    # compiled from assets/assets.qrc; registers the :/icons and :/themes resources
+    # (regenerate with `pyside6-rcc assets/assets.qrc -o ui/generated/assets_rc.py` after editing assets)
+    from ui.generated import assets_rc  # noqa: F401
+except Exception:  # pragma: no cover - fall back to the loose asset files
+    assets_rc = None
+
 APP_VERSION = "0.4.2"
 
+# Asset locations are fixed for the lifetime of the process (PyInstaller unpacks to _MEIPASS)
+BASE_DIR = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+if assets_rc is not None:
+    ICONS_DIR = ':/icons'
+    THEMES_DIR = ':/themes'
+else:
+    ICONS_DIR = os.path.join(BASE_DIR, 'assets', 'icons')
+    THEMES_DIR = os.path.join(BASE_DIR, 'assets', 'themes')
+FONTS_DIR = os.path.join(BASE_DIR, 'assets', 'fonts')
+
+_UI_BYTES_CACHE: dict[str, bytes] = {}
+
+_FALLBACK_QSS = {
+    'dark': '''
+        QWidget { background-color: #2b2b2b; color: #e6e6e6; }
+        QLineEdit, QComboBox, QScrollArea { background-color: #3c3c3c; }
+        QPushButton { background-color: #444444; color: #e6e6e6; border: none; padding: 4px; }
+        QPushButton:pressed { background-color: #555555; }
+        QLabel[cardHeader="true"], QLabel[cardSub="true"] { background: transparent; }
+    ''',
+    'light': '''
+        QLabel[cardHeader="true"], QLabel[cardSub="true"] { background: transparent; }
+    ''',
+}
+
+
+def _load_bundled_fonts() -> None:
+    """Register any fonts shipped under assets/fonts with Qt's font database."""
+    if not os.path.isdir(FONTS_DIR):
+        return
+    for name in sorted(os.listdir(FONTS_DIR)):
+        if name.lower().endswith(('.ttf', '.otf')):
+            QFontDatabase.addApplicationFont(os.path.join(FONTS_DIR, name))
+
+
+@lru_cache(maxsize=8)
+def _resolve_font_family(family: str) -> str:
+    """Return family if the font database has it, else the system UI family, so the
+    fallback match for a missing family (e.g. Inter) is only done once."""
+    if QFontDatabase.hasFamily(family):
+        return family
+    return QFontDatabase.systemFont(QFontDatabase.GeneralFont).family()
+
+
+@lru_cache(maxsize=64)
+def _make_font(family: str, point_size: int, bold: bool) -> QFont:
+    """Shared font instances; Qt copies QFont on write, so handing one to many widgets is cheap."""
+    font = QFont(_resolve_font_family(family), point_size)
+    font.setBold(bold)
+    return font
+
+
+@lru_cache(maxsize=64)
+def _make_tinted_icon(path: str, hex_colour: str) -> QIcon:
+    """Shared lazily tinted icons; each renders (and caches) a pixmap per size on first paint."""
+    return QIcon(TintedSvgIconEngine(path, hex_colour))
+
+
+# cards built per event-loop pass; a cold STL preview can take a noticeable fraction of a second
+_CARD_BUILD_BATCH = 2
+
+_QSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_QSS_SPACE_RE = re.compile(r'\s+')
+_QSS_PUNCT_RE = re.compile(r'\s*([{};,])\s*')
+
+
+def _minify_qss(text: str) -> str:
+    """Strip comments and redundant whitespace so Qt's stylesheet parser has less to scan.
+    Whitespace around ':' is kept, since a space there changes selector meaning."""
+    text = _QSS_COMMENT_RE.sub('', text)
+    text = _QSS_SPACE_RE.sub(' ', text)
+    return _QSS_PUNCT_RE.sub(r'\1', text).strip()
+
+
+def _load_theme_stylesheets() -> dict[str, str]:
+    """Read (and minify) both theme stylesheets once so toggling never touches the disk.
+    Falls back to a minimal inline stylesheet if a file read fails."""
+    sheets: dict[str, str] = {}
+    for theme in ('light', 'dark'):
+        # QFile reads both the compiled resources and plain files on disk
+        handle = QFile(f'{THEMES_DIR}/{theme}.qss')
+        try:
+            if not handle.open(QIODevice.ReadOnly):
+                raise OSError(handle.errorString())
+            sheets[theme] = _minify_qss(bytes(handle.readAll()).decode('utf-8'))
+        except Exception:
+            sheets[theme] = _minify_qss(_FALLBACK_QSS[theme])
+        finally:
+            handle.close()
+    return sheets
+
+
+def _open_ui_buffer(path: str) -> QBuffer | None:
+    """Return a read-only buffer over a .ui file, reading it from disk only once."""
+    data = _UI_BYTES_CACHE.get(path)
+    if data is None:
+        try:
+            with open(path, 'rb') as fh:
+                data = fh.read()
+        except OSError:
+            return None
+        _UI_BYTES_CACHE[path] = data
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    if not buffer.open(QIODevice.ReadOnly):
+        return None
+    return buffer
+
 
 class StorageSettingsDialog(QDialog):
     def __init__(self, current_path: str, delete_sources: bool = False, parent: QWidget | None = None):
@@ -102,8 +220,12 @@ class StorageSettingsDialog(QDialog):
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        # read the theme stylesheets on a worker thread while the .ui form is being built
+        qss_loader = ThreadPoolExecutor(max_workers=1)
+        self._qss_future = qss_loader.submit(_load_theme_stylesheets)
+        qss_loader.shutdown(wait=False)
         # theme state: False = light, True = dark
-        self.app_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+        self.app_dir = BASE_DIR
         self._config_dir = self._determine_config_dir()
         self._config_path = os.path.join(self._config_dir, 'config.json')
         self.config = self._load_config()
@@ -112,19 +234,36 @@ class MainWindow(QMainWindow):
         mode_theme = self.config.get('theme', 'light').lower()
         self.dark_theme = mode_theme == 'dark'
         self.models_root = self._resolve_models_root()
-        self._icons_dir = os.path.join(self.app_dir, 'assets', 'icons')
+        self._icons_dir = ICONS_DIR
+        # one directory listing answers every icon probe (works for :/icons resources too)
+        self._icon_set = frozenset(QDir(self._icons_dir).entryList(QDir.Files))
         self._active_icon_cache = {}
+        self._icon_path_cache = {}
+        self._theme_icon_cache = {}
+        self._qss_cache = None
         self._top_bar_layout = None
         self._top_bar_widget = None
         self._btn_eject_storage = None
+        # coalesce bursts of resize events into a single top-bar relayout
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._resize_top_buttons)
+        # last applied (button height, card font size) so unchanged resizes are skipped
+        self._last_resize_key = None
+        self._last_resize_width = None
         # track widgets/actions that need tinted icons reapplied on theme/resize
-        self._icon_targets = []  # entries: {'kind': 'button'|'action', 'widget': QWidget, 'action': QAction|None, 'path': str}
+        # keyed by (widget, action); entries: {'kind': 'button'|'action', 'widget': QWidget, 'action': QAction|None, 'path': str}
+        self._icon_targets = {}
         self.search_box = None
         self.sort_dropdown = None
         self.filter_dropdown = None
         self.loading_overlay = None
         self.loading_label = None
         self.loading_progress = None
+        self.ui = None
+        # objectName -> named objects of the loaded UI, indexed on the first _find call
+        self._widget_index = None
         self.load_ui()
         if not self._run_welcome_flow_if_needed():
             app = QApplication.instance()
@@ -145,18 +284,54 @@ class MainWindow(QMainWindow):
         self._visible_models = []
         self._preview_cache = {}
         self._thumbnail_sources = {}
+        # card shells whose contents are still to be built, keyed by card widget
+        self._pending_cards = {}
+        self._card_timer = QTimer(self)
+        self._card_timer.setSingleShot(True)
+        self._card_timer.setInterval(0)
+        self._card_timer.timeout.connect(self._build_visible_cards)
+        # current card fonts, applied to cards as they are built
+        self._card_header_font = None
+        self._card_sub_font = None
+        # decoded preview images and per-size card thumbnails share Qt's pixmap cache
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 20 * 1024))
         self._search_term = ''
         self._current_material_filter = 'All Materials'
         self._current_sort_index = 0
         self.populate_gallery()
 
+    def _find(self, cls, name: str):
+        """Look up a named child of this window or the loaded UI via a one-time name index."""
+        index = self._widget_index
+        if index is None:
+            index = {}
+            seen = set()
+            for root in (self, self.ui):
+                if root is None:
+                    continue
+                for obj in root.findChildren(QObject):
+                    obj_name = obj.objectName()
+                    if obj_name and id(obj) not in seen:
+                        seen.add(id(obj))
+                        index.setdefault(obj_name, []).append(obj)
+            self._widget_index = index
+        for obj in index.get(name, ()):
+            # skip wrappers whose C++ object was deleted after indexing
+            if isinstance(obj, cls) and shiboken6.isValid(obj):
+                return obj
+        # objects created after the index was built
+        found = self.findChild(cls, name)
+        if found is None and self.ui is not None:
+            found = self.ui.findChild(cls, name)
+        return found
+
     def load_ui(self):
         ui_path = os.path.join(self.app_dir, 'ui', 'forms', 'main_window.ui')
-        ui_file = QFile(ui_path)
-        ui_file.open(QFile.ReadOnly)
+        ui_buffer = _open_ui_buffer(ui_path)
         loader = QUiLoader()
-        loaded = loader.load(ui_file)
-        ui_file.close()
+        loaded = loader.load(ui_buffer) if ui_buffer is not None else None
+        if ui_buffer is not None:
+            ui_buffer.close()
 
         # The .ui file's top-level widget is a QMainWindow. We are already a QMainWindow
         # subclass, so extract the central widget from the loaded UI and set it here.
@@ -231,7 +406,13 @@ class MainWindow(QMainWindow):
         central = self.centralWidget()
         vlayout = central.layout() if central is not None else None
 
-        btn = self.findChild(QPushButton, 'btnThemeToggle') or (self.ui and self.ui.findChild(QPushButton, 'btnThemeToggle'))
+        # look each top-bar button up once; the same objects are reparented below
+        self._top_bar_widgets = {
+            name: self._find(QPushButton, name)
+            for name in ('btnThemeToggle', 'btnReload', 'btnImport', 'btnAddModel')
+        }
+
+        btn = self._top_bar_widgets['btnThemeToggle']
         if btn:
             self._theme_icon_path = self._resolve_icon_path('toggletheme.svg')
             btn.setToolTip('Toggle theme')
@@ -240,21 +421,21 @@ class MainWindow(QMainWindow):
             self.theme_button = btn
             self.top_bar_buttons.append(btn)
 
-        btn = self.findChild(QPushButton, 'btnReload') or (self.ui and self.ui.findChild(QPushButton, 'btnReload'))
+        btn = self._top_bar_widgets['btnReload']
         if btn:
             btn.clicked.connect(self.reload_files)
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             self._register_icon(btn, ('reload.svg', 'refresh.svg'))
             self.top_bar_buttons.append(btn)
 
-        btn = self.findChild(QPushButton, 'btnImport') or (self.ui and self.ui.findChild(QPushButton, 'btnImport'))
+        btn = self._top_bar_widgets['btnImport']
         if btn:
             btn.clicked.connect(self.import_files)
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             self._register_icon(btn, ('import.svg', 'upload.svg', 'open.svg'))
             self.top_bar_buttons.append(btn)
 
-        btn = self.findChild(QPushButton, 'btnAddModel') or (self.ui and self.ui.findChild(QPushButton, 'btnAddModel'))
+        btn = self._top_bar_widgets['btnAddModel']
         if btn:
             btn.clicked.connect(self.add_model)
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
@@ -265,26 +446,38 @@ class MainWindow(QMainWindow):
         # Move the top-row widgets into a new container widget so we can style the bar
         try:
             if vlayout is not None:
-                # remove the first item (assumed to be the original top bar layout)
-                item = vlayout.takeAt(0)
-                # create a new frame/container for the top bar
-                from PySide6.QtWidgets import QFrame, QHBoxLayout
-                top_bar = QFrame(central)
-                top_bar.setObjectName('topBarFrame')
-                top_bar_layout = QHBoxLayout(top_bar)
-                top_bar_layout.setContentsMargins(6, 6, 6, 6)
-                top_bar_layout.setSpacing(6)
-                self._top_bar_layout = top_bar_layout
-                self._top_bar_widget = top_bar
-                # add known buttons into the new layout in order
-                for name in ('btnThemeToggle', 'btnReload', 'btnImport', 'btnAddModel'):
-                    w = self.findChild(QPushButton, name) or (self.ui and self.ui.findChild(QPushButton, name))
-                    if w is not None:
-                        # reparent and add to new layout
-                        w.setParent(top_bar)
-                        top_bar_layout.addWidget(w)
-                # insert the new top_bar back into the vertical layout at position 0
-                vlayout.insertWidget(0, top_bar)
+                # hold repaints for the whole restructure so it settles in a single paint
+                central.setUpdatesEnabled(False)
+                try:
+                    # remove the first item (assumed to be the original top bar layout)
+                    item = vlayout.takeAt(0)
+                    # create a new frame/container for the top bar
+                    from PySide6.QtWidgets import QFrame, QHBoxLayout
+                    top_bar = QFrame(central)
+                    top_bar.setObjectName('topBarFrame')
+                    top_bar_layout = QHBoxLayout(top_bar)
+                    top_bar_layout.setContentsMargins(6, 6, 6, 6)
+                    top_bar_layout.setSpacing(6)
+                    self._top_bar_layout = top_bar_layout
+                    self._top_bar_widget = top_bar
+                    # block layout signals while the buttons move across
+                    vlayout.blockSignals(True)
+                    top_bar_layout.blockSignals(True)
+                    try:
+                        # add known buttons into the new layout in order
+                        for w in self._top_bar_widgets.values():
+                            if w:
+                                # reparent and add to new layout
+                                w.setParent(top_bar)
+                                top_bar_layout.addWidget(w)
+                        # insert the new top_bar back into the vertical layout at position 0
+                        vlayout.insertWidget(0, top_bar)
+                    finally:
+                        top_bar_layout.blockSignals(False)
+                        vlayout.blockSignals(False)
+                finally:
+                    central.setUpdatesEnabled(True)
+                central.update()
         except Exception:
             pass
 
@@ -296,7 +489,7 @@ class MainWindow(QMainWindow):
         # Prepare references to inputs on the second top bar for resizing
         self.top_bar_inputs = []
         from PySide6.QtWidgets import QLineEdit as _QLE
-        search = self.findChild(_QLE, 'searchBox') or (self.ui and self.ui.findChild(_QLE, 'searchBox'))
+        search = self._find(_QLE, 'searchBox')
         if search is not None:
             search.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             action = search.addAction(QIcon(), _QLE.LeadingPosition)
@@ -307,14 +500,14 @@ class MainWindow(QMainWindow):
             # capture initial search text for filtering
             self._search_term = search.text().strip()
         else:
-            fallback = self.findChild(QLabel, 'searchBox') or (self.ui and self.ui.findChild(QLabel, 'searchBox'))
+            fallback = self._find(QLabel, 'searchBox')
             if fallback is not None:
                 fallback.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
                 self.top_bar_inputs.append(fallback)
 
         from PySide6.QtWidgets import QComboBox
         for name in ('sortDropdown', 'filterDropdown'):
-            dd = self.findChild(QComboBox, name) or (self.ui and self.ui.findChild(QComboBox, name))
+            dd = self._find(QComboBox, name)
             if dd:
                 try:
                     dd.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
@@ -333,7 +526,7 @@ class MainWindow(QMainWindow):
         # Align the second top bar layout margins/spacings so height matches the first bar
         try:
             from PySide6.QtWidgets import QHBoxLayout as _QHB
-            bar2 = self.findChild(_QHB, 'topBar2Layout') or (self.ui and self.ui.findChild(_QHB, 'topBar2Layout'))
+            bar2 = self._find(_QHB, 'topBar2Layout')
             if bar2:
                 bar2.setContentsMargins(6, 6, 6, 6)
                 bar2.setSpacing(6)
@@ -341,6 +534,41 @@ class MainWindow(QMainWindow):
             pass
 
         self._create_loading_overlay()
+        self._prerender_startup_icons()
+
+    def _device_icon_size(self, dim: int) -> QSize:
+        """Pixel size an icon of dim logical pixels is painted at on this window's screen;
+        matches what TintedSvgIconEngine asks the tint cache for, so prerendering hits."""
+        try:
+            scale = self.devicePixelRatioF()
+        except Exception:
+            scale = 1.0
+        side = max(1, round(dim * scale))
+        return QSize(side, side)
+
+    def _prerender_startup_icons(self) -> None:
+        """Tint the top-bar icons and both theme-toggle variants as one parallel batch."""
+        colour = self._icon_colour_for_theme()
+        requests = []
+        for entry in self._icon_targets.values():
+            widget = entry.get('widget')
+            if widget and entry.get('path'):
+                dim = self._compute_icon_dim(widget)
+                requests.append((entry['path'], colour, self._device_icon_size(dim)))
+        theme_dim = self._theme_icon_dim() if hasattr(self, 'theme_button') else None
+        if theme_dim is not None:
+            for dark in (False, True):
+                path, theme_colour = self._theme_icon_source(dark)
+                if path:
+                    requests.append((path, theme_colour, self._device_icon_size(theme_dim)))
+        try:
+            prerender_tinted_icons(requests)
+        except Exception:
+            pass
+        # the first toggle in either direction is now a cache hit
+        if theme_dim is not None:
+            for dark in (False, True):
+                self._resolve_theme_icon(dark)
 
     def _show_about_dialog(self) -> None:
         description = (
@@ -561,9 +789,12 @@ class MainWindow(QMainWindow):
 
 
     def resizeEvent(self, event):
-        # Update button sizes whenever the main window resizes so they scale with the window
+        # Update button sizes whenever the main window resizes so they scale with the window;
+        # events arriving while the timer is pending share its single relayout (~60 Hz), and
+        # spurious events that report no size change (e.g. on re-show) schedule nothing
         try:
-            self._resize_top_buttons()
+            if event.size() != event.oldSize() and not self._resize_timer.isActive():
+                self._resize_timer.start()
         except Exception:
             pass
         try:
@@ -579,37 +810,65 @@ class MainWindow(QMainWindow):
         win_h = max(1, self.height())
         # choose a height between 28 and 56 px based on window height (roughly 4-8% of height)
         target_h = max(28, min(56, int(win_h * 0.06)))
+        # pick a card header font size based on window height, clamped to 12-18
+        card_pt = max(12, min(18, int(win_h * 0.026)))
+        win_w = self.width()
+        if not initial and (target_h, card_pt) == self._last_resize_key:
+            # sizes and fonts are unchanged; only a width change can alter the gallery columns
+            if win_w != self._last_resize_width:
+                self._last_resize_width = win_w
+                try:
+                    self.relayout_gallery()
+                except Exception:
+                    pass
+            else:
+                # a taller viewport may still uncover cards awaiting their preview
+                self._schedule_visible_cards()
+            return
+        self._last_resize_key = (target_h, card_pt)
+        self._last_resize_width = win_w
+
+        # everything below is the same for each button; work it out once
+        has_theme_icon = bool(getattr(self, '_theme_icon_path', None))
+        dark = getattr(self, 'dark_theme', False)
+        # make top-bar button text scale but cap it to avoid huge fonts
+        font_pt = min(16, max(10, int(target_h * 0.34)))
+        plain_font = _make_font('Inter', font_pt, False)
+        bold_font = _make_font('Inter', font_pt, True)
+        button_icon_dim = min(22, max(12, target_h - 14))
+        button_icon_size = QSize(button_icon_dim, button_icon_dim)
+        theme_btn_size = QSize(target_h, target_h)
 
         for btn in self.top_bar_buttons:
-            is_theme_btn = btn.objectName() == 'btnThemeToggle' and bool(getattr(self, '_theme_icon_path', None))
+            name = btn.objectName()
+            is_theme_btn = name == 'btnThemeToggle' and has_theme_icon
             if is_theme_btn:
-                btn.setFixedSize(QSize(target_h, target_h))
-                icon_dim = max(16, min(target_h - 8, 64))
+                if btn.minimumSize() != theme_btn_size or btn.maximumSize() != theme_btn_size:
+                    btn.setFixedSize(theme_btn_size)
+                icon_dim = self._theme_icon_dim()
                 try:
+                    # tint at the displayed size so Qt never rescales the pixmap at paint time
+                    icon = self._resolve_theme_icon(dark)
+                    if icon is not None and not icon.isNull():
+                        btn.setIcon(icon)
                     btn.setIconSize(QSize(icon_dim, icon_dim))
                 except Exception:
                     pass
-            else:
+            elif btn.minimumHeight() != target_h or btn.maximumHeight() != target_h:
                 # allow width to expand while fixing height
                 btn.setMinimumHeight(target_h)
                 btn.setMaximumHeight(target_h)
             # scale the button's font size so the text rescales with the button
             try:
-                # make top-bar button text scale but cap it to avoid huge fonts
-                font_pt = min(16, max(10, int(target_h * 0.34)))
-                f = btn.font() or QFont()
-                f.setFamily('Inter')
-                f.setPointSize(font_pt)
-                if btn.objectName() == 'btnAddModel':
-                    f.setBold(True)
-                else:
-                    f.setBold(False)
-                btn.setProperty('topBarButton', True)
-                btn.setFont(f)
+                if not btn.property('topBarButton'):
+                    btn.setProperty('topBarButton', True)
+                button_font = bold_font if name == 'btnAddModel' else plain_font
+                # initial=True passes mostly find the font already applied
+                if btn.font() != button_font:
+                    btn.setFont(button_font)
                 # Adjust icon size for icon-bearing buttons (only if explicitly set)
                 if not is_theme_btn and not btn.icon().isNull():
-                    icon_dim = min(22, max(12, target_h - 14))
-                    btn.setIconSize(QSize(icon_dim, icon_dim))
+                    btn.setIconSize(button_icon_size)
             except Exception:
                 # don't fail on font errors
                 pass
@@ -637,23 +896,19 @@ class MainWindow(QMainWindow):
                     btn_max_h = self._btn_add_model.maximumHeight() or self._btn_add_model.height() or self._btn_add_model.sizeHint().height() or target_h
             except Exception:
                 btn_max_h = target_h
+            input_font = _make_font('Inter', add_font_pt, False)
+            view_font = _make_font('Inter', max(9, add_font_pt - 1), False)
             for w in getattr(self, 'top_bar_inputs', []):
                 try:
-                    # make inputs' max height match the Add Model button's max side
-                    w.setMaximumHeight(btn_max_h)
-                    # keep min height aligned as well to avoid jitter
-                    w.setMinimumHeight(btn_max_h)
-                    f = w.font() or QFont()
-                    f.setFamily('Inter')
-                    f.setPointSize(add_font_pt)
-                    f.setBold(False)
-                    w.setFont(f)
+                    # make inputs' height match the Add Model button's max side; pinning min and
+                    # max together avoids jitter, and skipping unchanged values avoids re-layouts
+                    if w.minimumHeight() != btn_max_h or w.maximumHeight() != btn_max_h:
+                        w.setFixedHeight(btn_max_h)
+                    if w.font() != input_font:
+                        w.setFont(input_font)
                     # If this is a combo box, also adjust the view font for consistency
-                    if isinstance(w, QComboBox) and w.view():
-                        vf = w.view().font() or QFont()
-                        vf.setFamily('Inter')
-                        vf.setPointSize(max(9, add_font_pt - 1))
-                        w.view().setFont(vf)
+                    if isinstance(w, QComboBox) and w.view() and w.view().font() != view_font:
+                        w.view().setFont(view_font)
                 except Exception:
                     pass
         except Exception:
@@ -661,30 +916,22 @@ class MainWindow(QMainWindow):
 
         # Update card header fonts so they scale with window size as well
         try:
-            # pick a card header font size based on window height, clamped to 12-18
-            card_pt = max(12, min(18, int(win_h * 0.026)))
+            header_font = _make_font('Inter', card_pt, True)
+            self._card_header_font = header_font
             for lbl in getattr(self, 'card_headers', []):
                 try:
-                    lf = lbl.font() or QFont()
-                    lf.setFamily('Inter')
-                    lf.setPointSize(card_pt)
-                    lf.setBold(True)
-                    lbl.setFont(lf)
-                    # ensure the header text has no boxed background
-                    lbl.setStyleSheet('background: transparent;')
+                    # initial=True passes (theme toggles, rebuilds) mostly find the font already set
+                    if lbl.font() != header_font:
+                        lbl.setFont(header_font)
                 except Exception:
                     pass
             # card subtext slightly smaller and NOT bold
-            sub_pt = max(10, min(15, int(card_pt * 0.85)))
+            sub_font = _make_font('Inter', max(10, min(15, int(card_pt * 0.85))), False)
+            self._card_sub_font = sub_font
             for lbl in getattr(self, 'card_subtexts', []):
                 try:
-                    lf = lbl.font() or QFont()
-                    lf.setFamily('Inter')
-                    lf.setPointSize(sub_pt)
-                    lf.setBold(False)
-                    lbl.setFont(lf)
-                    # ensure subtext has no boxed background
-                    lbl.setStyleSheet('background: transparent;')
+                    if lbl.font() != sub_font:
+                        lbl.setFont(sub_font)
                 except Exception:
                     pass
         except Exception:
@@ -769,12 +1016,13 @@ class MainWindow(QMainWindow):
                     layout.removeWidget(btn)
                 if hasattr(self, 'top_bar_buttons') and btn in self.top_bar_buttons:
                     self.top_bar_buttons.remove(btn)
-                self._icon_targets = [t for t in self._icon_targets if t.get('widget') is not btn]
+                self._icon_targets.pop((btn, None), None)
                 btn.removeEventFilter(self)
                 btn.deleteLater()
                 self._btn_eject_storage = None
         try:
-            self._resize_top_buttons()
+            # the top-bar button set may have changed, so size it even if the window did not
+            self._resize_top_buttons(initial=True)
         except Exception:
             pass
 
@@ -922,10 +1170,10 @@ class MainWindow(QMainWindow):
 
         return True, ''
 
-    def _tint_icon(self, path: str, hex_colour: str, size: QSize | None = None) -> QIcon:
-        """Render an SVG (or image) and tint to hex_colour. Uses QSvgRenderer if available."""
+    def _tint_icon(self, path: str, hex_colour: str) -> QIcon:
+        """Icon for path tinted to hex_colour; rendered lazily at whatever size it is painted."""
         try:
-            return tint_icon(path, hex_colour, size)
+            return _make_tinted_icon(path, hex_colour)
         except Exception:
             return QIcon()
 
@@ -1115,18 +1363,24 @@ class MainWindow(QMainWindow):
     def _resolve_icon_path(self, candidates) -> str | None:
         if isinstance(candidates, str):
             candidates = (candidates,)
+        else:
+            candidates = tuple(candidates)
+        # every card asks for the same few icons; only resolve each set once
+        if candidates in self._icon_path_cache:
+            return self._icon_path_cache[candidates]
+        resolved = None
         for name in candidates:
-            path = os.path.join(self._icons_dir, name)
-            if os.path.exists(path):
-                return path
-        return None
+            if name in self._icon_set:
+                resolved = f'{self._icons_dir}/{name}'
+                break
+        self._icon_path_cache[candidates] = resolved
+        return resolved
 
     def _register_icon(self, widget, candidates, action=None) -> str | None:
         path = self._resolve_icon_path(candidates)
         if not path:
             return None
-        self._icon_targets = [t for t in self._icon_targets if not (t.get('widget') is widget and t.get('action') is action)]
-        self._icon_targets.append({'kind': 'action' if action else 'button', 'widget': widget, 'action': action, 'path': path})
+        self._icon_targets[(widget, action)] = {'kind': 'action' if action else 'button', 'widget': widget, 'action': action, 'path': path}
         return path
 
     def _load_models_data(self, progress: Callable[[int, int, str], None] | None = None) -> list[dict]:
@@ -1280,9 +1534,7 @@ class MainWindow(QMainWindow):
         if container is not None and layout is not None:
             return True
 
-        container = self.findChild(QWidget, 'scrollAreaWidgetContents')
-        if container is None and self.ui is not None:
-            container = self.ui.findChild(QWidget, 'scrollAreaWidgetContents')
+        container = self._find(QWidget, 'scrollAreaWidgetContents')
         if container is None:
             return False
 
@@ -1292,6 +1544,10 @@ class MainWindow(QMainWindow):
 
         self.gallery_container = container
         self.gallery_layout = layout
+        scroll = self._find(QScrollArea, 'scrollArea')
+        self.gallery_scroll = scroll
+        if scroll is not None:
+            scroll.verticalScrollBar().valueChanged.connect(self._schedule_visible_cards)
         try:
             self.gallery_layout.setHorizontalSpacing(8)
             self.gallery_layout.setVerticalSpacing(8)
@@ -1305,7 +1561,7 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'cards') and self.cards:
             for card in self.cards:
                 for btn in card.findChildren(QPushButton):
-                    self._icon_targets = [t for t in self._icon_targets if t.get('widget') is not btn]
+                    self._icon_targets.pop((btn, None), None)
                 for lbl in card.findChildren(QLabel):
                     if lbl in self._thumbnail_sources:
                         lbl.removeEventFilter(self)
@@ -1316,6 +1572,7 @@ class MainWindow(QMainWindow):
         self.card_subtexts = []
         self._visible_models = []
         self._thumbnail_sources = {}
+        self._pending_cards = {}
         if hasattr(self, 'gallery_layout') and self.gallery_layout is not None:
             while self.gallery_layout.count():
                 item = self.gallery_layout.takeAt(0)
@@ -1354,103 +1611,13 @@ class MainWindow(QMainWindow):
             return
 
         visible = []
-        theme_key = 'dark' if getattr(self, 'dark_theme', False) else 'light'
         total = len(models)
         for model in models:
+            # only an empty, fixed-size shell up front; contents are built once it nears the viewport
             card = QWidget()
             card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             card.setMinimumSize(QSize(260, 340))
-            layout = QVBoxLayout(card)
-            layout.setContentsMargins(5, 5, 5, 5)
-
-            thumbnail = QLabel()
-            thumbnail.setAlignment(Qt.AlignCenter)
-            thumbnail.setProperty('thumbnail', True)
-            thumbnail.setScaledContents(False)
-            thumbnail.setMinimumSize(160, 120)
-            thumbnail.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            thumbnail_pixmap = None
-            preview_path = model.get('preview_path')
-            if preview_path:
-                pix = QPixmap(preview_path)
-                if pix and not pix.isNull():
-                    thumbnail_pixmap = pix
-
-            if thumbnail_pixmap is None:
-                folder = model.get('folder')
-                model_candidates = list(model.get('model_files') or [])
-                fallback_name = model.get('model_file') or model.get('stl_file')
-                if fallback_name and fallback_name not in model_candidates:
-                    model_candidates.append(fallback_name)
-                stl_path = None
-                if folder:
-                    for candidate_name in model_candidates:
-                        candidate_path = os.path.join(folder, candidate_name)
-                        if os.path.exists(candidate_path):
-                            stl_path = candidate_path
-                            break
-                if stl_path:
-                    cache_key = (os.path.abspath(stl_path), theme_key)
-                    cached = self._preview_cache.get(cache_key)
-                    if cached is not None and not cached.isNull():
-                        thumbnail_pixmap = cached
-                    else:
-                        generated = render_stl_preview(stl_path, QSize(720, 720), dark_theme=(theme_key == 'dark'))
-                        if generated and not generated.isNull():
-                            thumbnail_pixmap = generated
-                            self._preview_cache[cache_key] = generated
-
-            if thumbnail_pixmap and not thumbnail_pixmap.isNull():
-                if thumbnail not in self._thumbnail_sources:
-                    thumbnail.installEventFilter(self)
-                self._thumbnail_sources[thumbnail] = thumbnail_pixmap
-                thumbnail.setPixmap(thumbnail_pixmap)
-                thumbnail.setAlignment(Qt.AlignCenter)
-                self._apply_thumbnail_pixmap(thumbnail)
-            else:
-                thumbnail.setText('No Preview')
-                if thumbnail in self._thumbnail_sources:
-                    thumbnail.removeEventFilter(self)
-                    self._thumbnail_sources.pop(thumbnail, None)
-            layout.addWidget(thumbnail)
-
-            name_label = QLabel(model.get('name', ''))
-            name_label.setProperty('cardHeader', True)
-            name_label.setStyleSheet('background: transparent; padding-left: 12px;')
-            layout.addWidget(name_label)
-            self.card_headers.append(name_label)
-
-            time_text = model.get('print_time') or 'N/A'
-            time_label = QLabel(f"Print time: {time_text}")
-            time_label.setProperty('cardSub', True)
-            time_label.setStyleSheet('background: transparent; padding-left: 16px;')
-            layout.addWidget(time_label)
-            self.card_subtexts.append(time_label)
-
-            btn_layout = QHBoxLayout()
-            btn_3d = QPushButton('3D View')
-            self._register_icon(btn_3d, ('3dview.svg', '3dviewbutton.svg'))
-            btn_3d.clicked.connect(partial(self.view_model, model))
-            btn_3d.setIconSize(QSize(18, 18))
-            btn_edit = QPushButton('Edit')
-            self._register_icon(btn_edit, ('editmodel.svg', 'editbutton.svg'))
-            btn_edit.clicked.connect(partial(self.edit_model, model))
-            btn_edit.setIconSize(QSize(18, 18))
-            active_button = QPushButton()
-            active_button.setCheckable(True)
-            active_button.setToolTip('Toggle to copy this model\'s G-code into the storage root')
-            active_button.blockSignals(True)
-            active_state = bool(model.get('active'))
-            active_button.setChecked(active_state)
-            self._style_active_button(active_button, active_state)
-            active_button.blockSignals(False)
-            active_button.toggled.connect(partial(self._on_card_active_toggled, model, active_button))
-            btn_layout.addWidget(active_button)
-            btn_layout.addWidget(btn_3d)
-            btn_layout.addWidget(btn_edit)
-            btn_layout.addStretch(1)
-            layout.addLayout(btn_layout)
-
+            self._pending_cards[card] = model
             card.setProperty('card', True)
             self.cards.append(card)
             visible.append(model)
@@ -1473,23 +1640,181 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _resolve_active_icon(self, size: int) -> QIcon | None:
-        try:
-            key = int(size)
-        except Exception:
-            key = 18
-        key = max(16, min(32, key))
+    def _build_card(self, card: QWidget, model: dict) -> None:
+        """Fill a gallery card shell with its preview, labels and buttons."""
+        layout = QVBoxLayout(card)
+        layout.setContentsMargins(5, 5, 5, 5)
+
+        thumbnail = QLabel()
+        thumbnail.setAlignment(Qt.AlignCenter)
+        thumbnail.setProperty('thumbnail', True)
+        thumbnail.setScaledContents(False)
+        thumbnail.setMinimumSize(160, 120)
+        thumbnail.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        layout.addWidget(thumbnail)
+
+        name_label = QLabel(model.get('name', ''))
+        name_label.setProperty('cardHeader', True)
+        if self._card_header_font is not None:
+            name_label.setFont(self._card_header_font)
+        layout.addWidget(name_label)
+        self.card_headers.append(name_label)
+
+        time_text = model.get('print_time') or 'N/A'
+        time_label = QLabel(f"Print time: {time_text}")
+        time_label.setProperty('cardSub', True)
+        if self._card_sub_font is not None:
+            time_label.setFont(self._card_sub_font)
+        layout.addWidget(time_label)
+        self.card_subtexts.append(time_label)
+
+        btn_layout = QHBoxLayout()
+        btn_3d = QPushButton('3D View')
+        path_3d = self._register_icon(btn_3d, ('3dview.svg', '3dviewbutton.svg'))
+        btn_3d.clicked.connect(partial(self.view_model, model))
+        btn_edit = QPushButton('Edit')
+        path_edit = self._register_icon(btn_edit, ('editmodel.svg', 'editbutton.svg'))
+        btn_edit.clicked.connect(partial(self.edit_model, model))
+        active_button = QPushButton()
+        active_button.setCheckable(True)
+        active_button.setToolTip('Toggle to copy this model\'s G-code into the storage root')
+        active_button.blockSignals(True)
+        active_state = bool(model.get('active'))
+        active_button.setChecked(active_state)
+        self._style_active_button(active_button, active_state)
+        active_button.blockSignals(False)
+        active_button.toggled.connect(partial(self._on_card_active_toggled, model, active_button))
+        btn_layout.addWidget(active_button)
+        btn_layout.addWidget(btn_3d)
+        btn_layout.addWidget(btn_edit)
+        btn_layout.addStretch(1)
+        layout.addLayout(btn_layout)
+
+        colour = self._icon_colour_for_theme()
+        for btn, path in ((btn_3d, path_3d), (btn_edit, path_edit)):
+            if path:
+                self._apply_button_icon(btn, path, colour)
+        self._load_card_thumbnail(thumbnail, model)
+
+    def _load_card_thumbnail(self, thumbnail: QLabel, model: dict) -> None:
+        theme_key = 'dark' if getattr(self, 'dark_theme', False) else 'light'
+        thumbnail_pixmap = None
+        preview_path = model.get('preview_path')
+        if preview_path:
+            thumbnail_pixmap = self._load_preview_pixmap(preview_path)
+
+        if thumbnail_pixmap is None:
+            folder = model.get('folder')
+            model_candidates = list(model.get('model_files') or [])
+            fallback_name = model.get('model_file') or model.get('stl_file')
+            if fallback_name and fallback_name not in model_candidates:
+                model_candidates.append(fallback_name)
+            stl_path = None
+            if folder:
+                for candidate_name in model_candidates:
+                    candidate_path = os.path.join(folder, candidate_name)
+                    if os.path.exists(candidate_path):
+                        stl_path = candidate_path
+                        break
+            if stl_path:
+                cache_key = (os.path.abspath(stl_path), theme_key)
+                cached = self._preview_cache.get(cache_key)
+                if cached is not None and not cached.isNull():
+                    thumbnail_pixmap = cached
+                else:
+                    generated = render_stl_preview(stl_path, QSize(720, 720), dark_theme=(theme_key == 'dark'))
+                    if generated and not generated.isNull():
+                        thumbnail_pixmap = generated
+                        self._preview_cache[cache_key] = generated
+
+        if thumbnail_pixmap and not thumbnail_pixmap.isNull():
+            if thumbnail not in self._thumbnail_sources:
+                thumbnail.installEventFilter(self)
+            self._thumbnail_sources[thumbnail] = thumbnail_pixmap
+            thumbnail.setPixmap(thumbnail_pixmap)
+            thumbnail.setAlignment(Qt.AlignCenter)
+            self._apply_thumbnail_pixmap(thumbnail)
+        else:
+            thumbnail.setText('No Preview')
+            if thumbnail in self._thumbnail_sources:
+                thumbnail.removeEventFilter(self)
+                self._thumbnail_sources.pop(thumbnail, None)
+
+    def _schedule_visible_cards(self, *_args) -> None:
+        if self._pending_cards and not self._card_timer.isActive():
+            self._card_timer.start()
+
+    def _build_visible_cards(self) -> None:
+        """Build pending cards inside the scroll viewport (plus one screen of overscan).
+
+        Works in batches of ``_CARD_BUILD_BATCH`` per timer tick, so input and
+        painting are handled between STL renders instead of after a whole screen.
+        """
+        if not self._pending_cards:
+            return
+        # flush pending layout requests so freshly placed cards have their final geometry
+        QApplication.sendPostedEvents(None, QEvent.LayoutRequest)
+        scroll = getattr(self, 'gallery_scroll', None)
+        visible = None
+        if scroll is not None:
+            viewport = scroll.viewport()
+            top = scroll.verticalScrollBar().value()
+            height = viewport.height()
+            visible = QRect(0, top - height, max(1, viewport.width()), height * 3)
+        built = 0
+        for card, model in list(self._pending_cards.items()):
+            if card.parentWidget() is None:
+                # not placed in the grid yet
+                continue
+            if visible is not None and not card.geometry().intersects(visible):
+                continue
+            if built >= _CARD_BUILD_BATCH:
+                # more cards in range: let the event loop run, then continue
+                self._card_timer.start()
+                return
+            self._pending_cards.pop(card, None)
+            self._build_card(card, model)
+            built += 1
+
+    def _resolve_active_icon(self) -> QIcon | None:
+        # the icon is size-independent; the button's iconSize picks the raster
+        colour = '#FFFFFF'
         cache = getattr(self, '_active_icon_cache', None)
         if cache is None:
             cache = {}
             self._active_icon_cache = cache
+        if colour in cache:
+            return cache[colour]
+        path = self._resolve_icon_path(('activate.svg', 'active.svg', 'check.svg'))
+        icon = self._tint_icon(path, colour) if path else None
+        cache[colour] = icon
+        return icon
+
+    def _theme_icon_dim(self) -> int:
+        # the toggle is a fixed square once sized, and its icon fills all but a 4px margin
+        btn_h = self.theme_button.maximumHeight()
+        if btn_h <= 0 or btn_h >= 16777215:
+            btn_h = self.theme_button.height() or self.theme_button.sizeHint().height() or 28
+        return max(16, min(btn_h - 8, 64))
+
+    def _theme_icon_source(self, dark: bool) -> tuple[str | None, str]:
+        candidates = ('lightmode.svg', 'sun.svg', 'toggletheme.svg') if dark else ('darkmode.svg', 'moon.svg', 'toggletheme.svg')
+        path = self._resolve_icon_path(candidates)
+        if not path:
+            path = getattr(self, '_theme_icon_path', None)
+        else:
+            self._theme_icon_path = path
+        return path, ('#000000' if not dark else '#FFFFFF')
+
+    def _resolve_theme_icon(self, dark: bool) -> QIcon | None:
+        key = bool(dark)
+        cache = self._theme_icon_cache
         if key in cache:
             return cache[key]
-        path = self._resolve_icon_path(('activate.svg', 'active.svg', 'check.svg'))
+        path, colour = self._theme_icon_source(dark)
         if not path:
-            cache[key] = None
             return None
-        icon = self._tint_icon(path, '#FFFFFF', QSize(key, key))
+        icon = self._tint_icon(path, colour)
         cache[key] = icon
         return icon
 
@@ -1512,7 +1837,7 @@ class MainWindow(QMainWindow):
         except Exception:
             dim = 32
         dim = max(16, min(24, int(dim)))
-        icon = self._resolve_active_icon(dim)
+        icon = self._resolve_active_icon()
         if icon and not icon.isNull():
             button.setIcon(icon)
             button.setIconSize(QSize(dim, dim))
@@ -1553,14 +1878,32 @@ class MainWindow(QMainWindow):
         size = label.size()
         if size.width() <= 0 or size.height() <= 0:
             return
-        scaled = pixmap.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        if scaled.width() > size.width() or scaled.height() > size.height():
-            crop_x = max(0, (scaled.width() - size.width()) // 2)
-            crop_y = max(0, (scaled.height() - size.height()) // 2)
-            scaled = scaled.copy(crop_x, crop_y, min(size.width(), scaled.width()), min(size.height(), scaled.height()))
+        cache_key = f'zprint-thumb:{pixmap.cacheKey()}:{size.width()}x{size.height()}'
+        scaled = QPixmapCache.find(cache_key)
+        if scaled is None or scaled.isNull():
+            scaled = pixmap.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            if scaled.width() > size.width() or scaled.height() > size.height():
+                crop_x = max(0, (scaled.width() - size.width()) // 2)
+                crop_y = max(0, (scaled.height() - size.height()) // 2)
+                scaled = scaled.copy(crop_x, crop_y, min(size.width(), scaled.width()), min(size.height(), scaled.height()))
+            QPixmapCache.insert(cache_key, scaled)
         label.setPixmap(scaled)
         label.setAlignment(Qt.AlignCenter)
 
+    def _load_preview_pixmap(self, path: str) -> QPixmap | None:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        cache_key = f'zprint-preview:{os.path.abspath(path)}:{mtime}'
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(path)
+            if pixmap.isNull():
+                return None
+            QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
+
     def _populate_material_filters(self, models: list[dict]):
         if not self.filter_dropdown:
             return
@@ -1683,36 +2026,56 @@ class MainWindow(QMainWindow):
             h = 28
         return min(22, max(12, h - 14))
 
+    def _apply_button_icon(self, btn, path: str, colour: str) -> None:
+        dim = self._compute_icon_dim(btn)
+        icon = self._tint_icon(path, colour)
+        if icon and not icon.isNull():
+            btn.setIcon(icon)
+            try:
+                btn.setIconSize(QSize(dim, dim))
+            except Exception:
+                pass
+
     def _update_all_tinted_icons(self):
         """Reapply tinted icons for all registered targets (toolbar/search/card)."""
         colour = self._icon_colour_for_theme()
-        for entry in list(self._icon_targets):
+        # a gallery rebuild registers many card buttons at once; tint the uncached ones in parallel
+        requests = []
+        for entry in self._icon_targets.values():
+            widget = entry.get('widget')
+            path = entry.get('path')
+            if widget and path:
+                dim = self._compute_icon_dim(widget)
+                requests.append((path, colour, self._device_icon_size(dim)))
+        try:
+            prerender_tinted_icons(requests)
+        except Exception:
+            pass
+        for entry in list(self._icon_targets.values()):
             kind = entry.get('kind')
             path = entry.get('path')
-            if not path or not os.path.exists(path):
+            if not path:
+                # paths were checked when the target was registered
                 continue
             if kind == 'button':
                 btn = entry.get('widget')
                 if not btn:
                     continue
-                dim = self._compute_icon_dim(btn)
-                icon = self._tint_icon(path, colour, QSize(dim, dim))
-                if icon and not icon.isNull():
-                    btn.setIcon(icon)
-                    try:
-                        btn.setIconSize(QSize(dim, dim))
-                    except Exception:
-                        pass
+                self._apply_button_icon(btn, path, colour)
             elif kind == 'action':
                 act = entry.get('action')
                 w = entry.get('widget')
                 if not act or not w:
                     continue
-                dim = self._compute_icon_dim(w)
-                icon = self._tint_icon(path, colour, QSize(dim, dim))
+                icon = self._tint_icon(path, colour)
                 if icon and not icon.isNull():
                     act.setIcon(icon)
 
+    def _theme_stylesheets(self) -> dict[str, str]:
+        if self._qss_cache is None:
+            self._qss_cache = self._qss_future.result()
+        return self._qss_cache
+
     def toggle_theme(self):
         # Toggle theme state and apply the corresponding QSS
         self.dark_theme = not getattr(self, 'dark_theme', False)
@@ -1721,51 +2084,20 @@ class MainWindow(QMainWindow):
         self._save_config()
 
     def apply_theme(self, dark: bool):
-        """Load the QSS for the chosen theme (dark=True) or light (dark=False).
-        Falls back to a minimal inline stylesheet if the file read fails."""
-        themes_dir = os.path.join(os.path.dirname(__file__), 'assets', 'themes')
-        qss_name = 'dark.qss' if dark else 'light.qss'
-        qss_path = os.path.join(themes_dir, qss_name)
-
-        qss_loaded = False
-        if os.path.exists(qss_path):
-            try:
-                with open(qss_path, 'r', encoding='utf-8') as fh:
-                    QApplication.instance().setStyleSheet(fh.read())
-                    qss_loaded = True
-            except Exception:
-                qss_loaded = False
-
-        if not qss_loaded:
-            if dark:
-                dark_qss = '''
-                QWidget { background-color: #2b2b2b; color: #e6e6e6; }
-                QLineEdit, QComboBox, QScrollArea { background-color: #3c3c3c; }
-                QPushButton { background-color: #444444; color: #e6e6e6; border: none; padding: 4px; }
-                QPushButton:pressed { background-color: #555555; }
-                '''
-                QApplication.instance().setStyleSheet(dark_qss)
-            else:
-                QApplication.instance().setStyleSheet('')
-
-        theme_icon_candidates = ('lightmode.svg', 'sun.svg', 'toggletheme.svg') if dark else ('darkmode.svg', 'moon.svg', 'toggletheme.svg')
-        theme_icon_path = self._resolve_icon_path(theme_icon_candidates)
-        if not theme_icon_path:
-            theme_icon_path = getattr(self, '_theme_icon_path', None)
-        else:
-            self._theme_icon_path = theme_icon_path
-
-        if hasattr(self, 'theme_button') and theme_icon_path:
-            btn_h = self.theme_button.height() or self.theme_button.sizeHint().height() or 28
-            dim = min(24, max(16, btn_h - 10))
-            colour = '#000000' if not dark else '#FFFFFF'
-            icon = self._tint_icon(theme_icon_path, colour, QSize(dim, dim))
-            if icon and not icon.isNull():
+        """Apply the QSS for the chosen theme (dark=True) or light (dark=False).
+        The stylesheets (or their inline fallbacks) were loaded once at startup."""
+        QApplication.instance().setStyleSheet(self._theme_stylesheets()['dark' if dark else 'light'])
+
+        if hasattr(self, 'theme_button'):
+            dim = self._theme_icon_dim()
+            # both theme variants are kept after first use, so toggling back is a dict lookup
+            icon = self._resolve_theme_icon(dark)
+            if icon is not None and not icon.isNull():
                 self.theme_button.setIcon(icon)
                 self.theme_button.setIconSize(QSize(dim, dim))
                 if self.theme_button.text():
                     self.theme_button.setText('')
-            else:
+            elif icon is not None:
                 if not self.theme_button.text():
                     self.theme_button.setText('Theme')
                 self.theme_button.setIcon(QIcon())
@@ -1779,18 +2111,16 @@ class MainWindow(QMainWindow):
 
     def _load_ui_widget(self, relative_path: str, parent=None):
         path = os.path.join(self.app_dir, relative_path)
-        if not os.path.exists(path):
-            return None
-        ui_file = QFile(path)
-        if not ui_file.open(QFile.ReadOnly):
+        ui_buffer = _open_ui_buffer(path)
+        if ui_buffer is None:
             return None
         loader = QUiLoader()
         try:
-            widget = loader.load(ui_file, parent)
+            widget = loader.load(ui_buffer, parent)
         except Exception:
             widget = None
         finally:
-            ui_file.close()
+            ui_buffer.close()
         return widget
 
     def _create_loading_overlay(self):
@@ -2273,6 +2603,11 @@ class MainWindow(QMainWindow):
         cols = max(2, int((available_w + spacing) / (min_card_w + spacing)))
         cols = min(cols, 3)
 
+        if cols == getattr(self, '_last_gallery_cols', 0) and layout.count() == len(self.cards):
+            # the grid already holds these cards in this many columns
+            self._schedule_visible_cards()
+            return
+
         # Ensure each active column shares the same stretch so widths stay uniform
         last_cols = max(cols, getattr(self, '_last_gallery_cols', 0))
         for col in range(last_cols):
@@ -2280,25 +2615,37 @@ class MainWindow(QMainWindow):
 
         self._last_gallery_cols = cols
 
-        # Clear current layout placements (but keep widgets alive)
+        # Hold repaints and layout signals while the grid is rearranged so the cards are laid out once at the end
+        container.setUpdatesEnabled(False)
+        layout.blockSignals(True)
         try:
-            while layout.count():
-                item = layout.takeAt(0)
-                w = item.widget()
-                if w is not None:
-                    layout.removeWidget(w)
-        except Exception:
-            pass
-
-        # Add cards row by row
-        r = 0
-        c = 0
-        for card in self.cards:
-            layout.addWidget(card, r, c)
-            c += 1
-            if c >= cols:
-                c = 0
-                r += 1
+            # current (row, col) of every card already in the grid
+            placed = {}
+            for index in range(layout.count()):
+                widget = layout.itemAt(index).widget()
+                if widget is not None:
+                    placed[widget] = layout.getItemPosition(index)[:2]
+            card_set = set(self.cards)
+            # drop anything else left in the grid (e.g. items from a previous populate pass)
+            for index in reversed(range(layout.count())):
+                if layout.itemAt(index).widget() not in card_set:
+                    layout.takeAt(index)
+
+            # Only move cards whose row/column changed; the leading cards usually stay put
+            for index, card in enumerate(self.cards):
+                position = divmod(index, cols)
+                current = placed.get(card)
+                if current == position:
+                    continue
+                if current is not None:
+                    layout.removeWidget(card)
+                layout.addWidget(card, *position)
+        finally:
+            layout.blockSignals(False)
+            container.setUpdatesEnabled(True)
+        container.update()
+        # the grid geometry settles on the next event loop pass; pick up newly visible cards then
+        self._schedule_visible_cards()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -2306,21 +2653,20 @@ if __name__ == "__main__":
     app.setApplicationVersion(APP_VERSION)
     # set global fonts (will fallback to system fonts if Inter / JetBrains Mono are not installed)
     try:
-        app.setFont(QFont('Inter', 13))
+        _load_bundled_fonts()
+        app.setFont(_make_font('Inter', 13, False))
     except Exception:
         pass
     window = MainWindow()
     window.show()
     # set application/window icon and title if a logo exists (support common local names)
-    icons_dir = os.path.join(os.path.dirname(__file__), 'assets', 'icons')
-    for logo_name in ('logo.svg', 'applogo.svg'):
-        logo_path = os.path.join(icons_dir, logo_name)
-        if os.path.exists(logo_path):
-            app.setWindowIcon(QIcon(logo_path))
-            window.setWindowIcon(QIcon(logo_path))
-            break
+    logo_path = window._resolve_icon_path(('logo.svg', 'applogo.svg'))
+    if logo_path:
+        logo_icon = QIcon(logo_path)
+        app.setWindowIcon(logo_icon)
+        window.setWindowIcon(logo_icon)
     window.setWindowTitle(f'zPrint {APP_VERSION}')
     # Run an initial sizing pass after show to pick up platform metrics
     from PySide6.QtCore import QTimer
-    QTimer.singleShot(0, window._resize_top_buttons)
+    QTimer.singleShot(0, partial(window._resize_top_buttons, initial=True))
     sys.exit(app.exec())
\ No newline at end of file
@@ -22,6 +22,14 @@ if (Test-Path $pyInstallerDist) {
     Remove-Item $pyInstallerDist -Recurse -Force
 }
 
+Write-Host 'Compiling Qt resources...' -ForegroundColor Cyan
+$qrcPath = Join-Path $root 'assets\assets.qrc'
+$resourceModule = Join-Path $root 'ui\generated\assets_rc.py'
+pyside6-rcc $qrcPath -o $resourceModule
+if ($LASTEXITCODE -ne 0) {
+    throw "pyside6-rcc failed to compile $qrcPath"
+}
+
 Write-Host 'Running PyInstaller...' -ForegroundColor Cyan
 pyinstaller --clean --noconfirm $specPath
 
@@ -0,0 +1,26 @@
+from core.svg_rendering import _NEEDS_XML, _strip_background_rects_fast
+
+
+def test_strips_double_quoted_background_rect():
+    raw = b'<svg viewBox="0 0 24 24"><rect width="100%" height="100%" fill="#fff"/><path d="M0 0h24"/></svg>'
+    assert _strip_background_rects_fast(raw) == b'<svg viewBox="0 0 24 24"><path d="M0 0h24"/></svg>'
+
+
+def test_strips_single_quoted_background_rect():
+    raw = b"<svg viewBox='0 0 24 24'><rect width='100%' height='100%' fill='#fff'/><path d='M0 0h24'/></svg>"
+    assert _strip_background_rects_fast(raw) == b"<svg viewBox='0 0 24 24'><path d='M0 0h24'/></svg>"
+
+
+def test_strips_single_quoted_viewbox_sized_rect():
+    raw = b"<svg viewBox='0 0 24 24'><rect x='0' y='0' width='24' height='24' fill='white'/></svg>"
+    assert _strip_background_rects_fast(raw) == b"<svg viewBox='0 0 24 24'></svg>"
+
+
+def test_keeps_unfilled_rect():
+    raw = b"<svg viewBox='0 0 24 24'><rect width='100%' height='100%' fill='none'/></svg>"
+    assert _strip_background_rects_fast(raw) is None
+
+
+def test_defers_prefixed_rects_to_xml():
+    raw = b'<svg:svg xmlns:svg="http://www.w3.org/2000/svg"><svg:rect width="100%"/></svg:svg>'
+    assert _strip_background_rects_fast(raw) is _NEEDS_XML
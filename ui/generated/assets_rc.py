@@ -0,0 +1,1423 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x12.\
+\x0a\
+/* Dark theme QS\
+S for zPrint - i\
+mplemented palet\
+te\x0a   Primary Bl\
+ue: #007AFF, Dar\
+k Blue: #00457C\x0a\
+   Success: #34C\
+759, Error: #FF3\
+B30\x0a   Dark neut\
+rals used for su\
+rfaces\x0a*/\x0a\x0aQWidg\
+et {\x0a  backgroun\
+d-color: #2b2b2b\
+;\x0a  color: #e6e6\
+e6;\x0a  font-famil\
+y: \x22Segoe UI\x22, R\
+oboto, \x22Helvetic\
+a Neue\x22, Arial;\x0a\
+}\x0a\x0a/* central ar\
+ea slightly ligh\
+ter than page ba\
+ckground for sep\
+aration */\x0aQWidg\
+et#centralwidget\
+, QFrame#content\
+ {\x0a  background-\
+color: #232629;\x0a\
+}\x0a\x0aQLineEdit, QC\
+omboBox, QScroll\
+Area, QTextEdit \
+{\x0a  background-c\
+olor: #2f3335;\x0a \
+ color: #e6e6e6;\
+\x0a  border: 1px s\
+olid #3b3f41;\x0a  \
+border-radius: 4\
+px;\x0a}\x0a\x0a/* Refine\
+d dropdown (QCom\
+boBox) aesthetic\
+s */\x0aQComboBox {\
+\x0a  padding: 6px \
+32px 6px 10px; /\
+* space for arro\
+w */\x0a}\x0aQComboBox\
+:hover {\x0a  borde\
+r-color: #4b4f51\
+;\x0a}\x0aQComboBox:fo\
+cus {\x0a  border-c\
+olor: #007AFF;\x0a}\
+\x0a/* Drop-down bu\
+tton area */\x0aQCo\
+mboBox::drop-dow\
+n {\x0a  subcontrol\
+-origin: padding\
+;\x0a  subcontrol-p\
+osition: top rig\
+ht;\x0a  width: 28p\
+x;\x0a  border-left\
+: 1px solid #3b3\
+f41;\x0a  backgroun\
+d: #2b2f31;\x0a}\x0a/*\
+ Popup list */\x0aQ\
+ComboBox QAbstra\
+ctItemView {\x0a  b\
+ackground: #2f33\
+35;\x0a  color: #e6\
+e6e6;\x0a  border: \
+1px solid #3b3f4\
+1;\x0a  selection-b\
+ackground-color:\
+ #063A6B; /* coh\
+esive with top b\
+ar */\x0a  selectio\
+n-color: #FFFFFF\
+;\x0a  outline: 0;\x0a\
+}\x0a\x0aQCheckBox {\x0a \
+ spacing: 8px;\x0a}\
+\x0a\x0aQCheckBox::ind\
+icator {\x0a  width\
+: 18px;\x0a  height\
+: 18px;\x0a  border\
+-radius: 4px;\x0a  \
+border: 1px soli\
+d #4b4f51;\x0a  bac\
+kground: #2f3335\
+;\x0a}\x0a\x0aQCheckBox::\
+indicator:hover \
+{\x0a  border-color\
+: #5c6062;\x0a}\x0a\x0aQC\
+heckBox::indicat\
+or:checked {\x0a  b\
+ackground-color:\
+ #007AFF;\x0a  bord\
+er-color: #0070E\
+0;\x0a  image: url(\
+:/qt-project.org\
+/styles/commonst\
+yle/images/check\
+box_checked.png)\
+;\x0a}\x0a\x0aQCheckBox::\
+indicator:unchec\
+ked {\x0a  image: n\
+one;\x0a}\x0a\x0aQCheckBo\
+x::indicator:ind\
+eterminate {\x0a  i\
+mage: url(:/qt-p\
+roject.org/style\
+s/commonstyle/im\
+ages/checkbox_pa\
+rtiallychecked.p\
+ng);\x0a}\x0a\x0aQCheckBo\
+x::indicator:dis\
+abled {\x0a  backgr\
+ound: #2b2f31;\x0a \
+ border-color: #\
+3b3f41;\x0a}\x0a\x0a/* Pr\
+imary action sty\
+ling: use same b\
+lue for contrast\
+ on dark.\x0a   But\
+tons remain colo\
+red to be visibl\
+e on dark backgr\
+ounds. */\x0a/* Def\
+ault button styl\
+e - neutral on d\
+ark background *\
+/\x0aQPushButton {\x0a\
+  background-col\
+or: #2f3335;\x0a  c\
+olor: #e6e6e6;\x0a \
+ border: 1px sol\
+id #3b3f41;\x0a  pa\
+dding: 6px 12px;\
+\x0a  border-radius\
+: 6px;\x0a  font-we\
+ight: normal;\x0a}\x0a\
+\x0aQPushButton:hov\
+er {\x0a  backgroun\
+d-color: #35393b\
+;\x0a}\x0a\x0aQPushButton\
+:disabled {\x0a  ba\
+ckground-color: \
+#2b2f31;\x0a  color\
+: #8f9496;\x0a}\x0a\x0a/*\
+ Make the Add Mo\
+del button the p\
+rimary blue CTA \
+and bold */\x0aQPus\
+hButton#btnAddMo\
+del {\x0a  backgrou\
+nd-color: #007AF\
+F;\x0a  color: #FFF\
+FFF;\x0a  border: n\
+one;\x0a  font-weig\
+ht: 700;\x0a}\x0a\x0a/* T\
+heme toggle: bla\
+ck in dark mode \
+*/\x0aQPushButton#b\
+tnThemeToggle {\x0a\
+  background-col\
+or: #000000;\x0a  c\
+olor: #FFFFFF;\x0a \
+ border: 1px sol\
+id #111111;\x0a}\x0a\x0a/\
+* Top-bar button\
+s (Reload, Impor\
+t, Eject) use a \
+secondary neutra\
+l distinct from \
+Add Model */\x0a/* \
+Reload/Import/Ej\
+ect as grey in d\
+ark mode */\x0aQPus\
+hButton#btnReloa\
+d, QPushButton#b\
+tnImport, QPushB\
+utton#btnEjectSt\
+orage {\x0a  backgr\
+ound-color: #3b3\
+f41;\x0a  color: #e\
+6e6e6;\x0a  border:\
+ 1px solid #4b4f\
+51;\x0a}\x0aQPushButto\
+n#btnReload:hove\
+r, QPushButton#b\
+tnImport:hover, \
+QPushButton#btnE\
+jectStorage:hove\
+r { background-c\
+olor: #44484a; }\
+\x0a\x0a/* Top bar con\
+tainer backgroun\
+d (distinct blue\
+) */\x0aQWidget#top\
+BarFrame {\x0a  bac\
+kground-color: #\
+063A6B;\x0a}\x0a\x0a/* Ca\
+rd container bor\
+der */\x0aQWidget[c\
+ard=\x22true\x22] {\x0a  \
+border: 1px soli\
+d #3b3f41;\x0a  bor\
+der-radius: 6px;\
+\x0a  background-co\
+lor: #232629;\x0a  \
+padding: 6px;\x0a}\x0a\
+\x0a/* Success / Er\
+ror indicators *\
+/\x0aQLabel[status=\
+\x22success\x22] { col\
+or: #34C759; }\x0aQ\
+Label[status=\x22er\
+ror\x22] { color: #\
+FF3B30; }\x0a\x0aQTool\
+Tip {\x0a  backgrou\
+nd-color: #1f1f1\
+f;\x0a  color: #e6e\
+6e6;\x0a  border: 1\
+px solid #444444\
+;\x0a}\x0a\x0a/* Gallery \
+thumbnail style \
+*/\x0aQLabel[thumbn\
+ail=\x22true\x22] {\x0a  \
+border: 1px soli\
+d #3b3f41;\x0a}\x0a\x0a/*\
+ Gallery card te\
+xt */\x0aQLabel[car\
+dHeader=\x22true\x22] \
+{\x0a  background: \
+transparent;\x0a  p\
+adding-left: 12p\
+x;\x0a}\x0aQLabel[card\
+Sub=\x22true\x22] {\x0a  \
+background: tran\
+sparent;\x0a  paddi\
+ng-left: 16px;\x0a}\
+\x0a\x0a/* Modern scro\
+llbars */\x0aQScrol\
+lBar:vertical {\x0a\
+  background: tr\
+ansparent;\x0a  wid\
+th: 12px;\x0a  marg\
+in: 6px 3px 6px \
+0px;\x0a  border-ra\
+dius: 6px;\x0a}\x0aQSc\
+rollBar:horizont\
+al {\x0a  backgroun\
+d: transparent;\x0a\
+  height: 12px;\x0a\
+  margin: 0px 6p\
+x 3px 6px;\x0a  bor\
+der-radius: 6px;\
+\x0a}\x0aQScrollBar::h\
+andle:vertical {\
+\x0a  background-co\
+lor: rgba(255, 2\
+55, 255, 90);\x0a  \
+border-radius: 6\
+px;\x0a  min-height\
+: 28px;\x0a}\x0aQScrol\
+lBar::handle:ver\
+tical:hover, QSc\
+rollBar::handle:\
+vertical:pressed\
+ {\x0a  background-\
+color: #4092ff;\x0a\
+}\x0aQScrollBar::ha\
+ndle:horizontal \
+{\x0a  background-c\
+olor: rgba(255, \
+255, 255, 90);\x0a \
+ border-radius: \
+6px;\x0a  min-width\
+: 28px;\x0a}\x0aQScrol\
+lBar::handle:hor\
+izontal:hover, Q\
+ScrollBar::handl\
+e:horizontal:pre\
+ssed {\x0a  backgro\
+und-color: #4092\
+ff;\x0a}\x0aQScrollBar\
+::add-line, QScr\
+ollBar::sub-line\
+ {\x0a  height: 0px\
+;\x0a  width: 0px;\x0a\
+}\x0aQScrollBar::ad\
+d-page, QScrollB\
+ar::sub-page {\x0a \
+ background: tra\
+nsparent;\x0a}\x0a\x0a\
+\x00\x00\x12@\
+\x0a\
+/* Light theme Q\
+SS for zPrint - \
+implemented pale\
+tte\x0a   Backgroun\
+ds: White (#FFFF\
+FF), Light Gray \
+(#F5F7FA), Mediu\
+m Gray (#E0E6ED)\
+\x0a   Primary Blue\
+: #007AFF, Dark \
+Blue: #00457C\x0a  \
+ Success: #34C75\
+9, Error: #FF3B3\
+0\x0a*/\x0a\x0aQWidget {\x0a\
+  /* page-level \
+background (subt\
+le) */\x0a  backgro\
+und-color: #F5F7\
+FA;\x0a  color: #22\
+2222;\x0a  font-fam\
+ily: \x22Segoe UI\x22,\
+ Roboto, \x22Helvet\
+ica Neue\x22, Arial\
+;\x0a}\x0a\x0a/* Make the\
+ central content\
+ slightly 'card-\
+like' on white *\
+/\x0aQWidget#centra\
+lwidget, QFrame#\
+content {\x0a  back\
+ground-color: #F\
+FFFFF;\x0a}\x0a\x0aQLineE\
+dit, QComboBox, \
+QScrollArea, QTe\
+xtEdit {\x0a  backg\
+round-color: #FF\
+FFFF;\x0a  color: #\
+222222;\x0a  border\
+: 1px solid #E0E\
+6ED;\x0a  border-ra\
+dius: 4px;\x0a}\x0a\x0a/*\
+ Refined dropdow\
+n (QComboBox) ae\
+sthetics */\x0aQCom\
+boBox {\x0a  paddin\
+g: 6px 32px 6px \
+10px; /* space f\
+or arrow */\x0a}\x0aQC\
+omboBox:hover {\x0a\
+  border-color: \
+#D0D6DE;\x0a}\x0aQComb\
+oBox:focus {\x0a  b\
+order-color: #00\
+7AFF;\x0a}\x0a/* Drop-\
+down button area\
+ */\x0aQComboBox::d\
+rop-down {\x0a  sub\
+control-origin: \
+padding;\x0a  subco\
+ntrol-position: \
+top right;\x0a  wid\
+th: 28px;\x0a  bord\
+er-left: 1px sol\
+id #E0E6ED;\x0a  ba\
+ckground: #F5F7F\
+A;\x0a}\x0a/* Popup li\
+st */\x0aQComboBox \
+QAbstractItemVie\
+w {\x0a  background\
+: #FFFFFF;\x0a  col\
+or: #222222;\x0a  b\
+order: 1px solid\
+ #E0E6ED;\x0a  sele\
+ction-background\
+-color: #EAF3FF;\
+\x0a  selection-col\
+or: #222222;\x0a  o\
+utline: 0;\x0a}\x0a\x0aQC\
+heckBox {\x0a  spac\
+ing: 8px;\x0a}\x0a\x0aQCh\
+eckBox::indicato\
+r {\x0a  width: 18p\
+x;\x0a  height: 18p\
+x;\x0a  border-radi\
+us: 4px;\x0a  borde\
+r: 1px solid #D0\
+D6DE;\x0a  backgrou\
+nd: #FFFFFF;\x0a}\x0a\x0a\
+QCheckBox::indic\
+ator:hover {\x0a  b\
+order-color: #B8\
+C2CE;\x0a}\x0a\x0aQCheckB\
+ox::indicator:ch\
+ecked {\x0a  backgr\
+ound-color: #007\
+AFF;\x0a  border-co\
+lor: #005FCC;\x0a  \
+image: url(:/qt-\
+project.org/styl\
+es/commonstyle/i\
+mages/checkbox_c\
+hecked.png);\x0a}\x0a\x0a\
+QCheckBox::indic\
+ator:unchecked {\
+\x0a  image: none;\x0a\
+}\x0a\x0aQCheckBox::in\
+dicator:indeterm\
+inate {\x0a  image:\
+ url(:/qt-projec\
+t.org/styles/com\
+monstyle/images/\
+checkbox_partial\
+lychecked.png);\x0a\
+}\x0a\x0aQCheckBox::in\
+dicator:disabled\
+ {\x0a  background:\
+ #EDEFF2;\x0a  bord\
+er-color: #D0D6D\
+E;\x0a}\x0a\x0a/* Primary\
+ action styling \
+*/\x0a/* Default bu\
+tton style - neu\
+tral (not all bu\
+ttons should be \
+CTA blue)\x0a   We'\
+ll override spec\
+ific buttons (li\
+ke btnAddModel) \
+to be the primar\
+y CTA. */\x0aQPushB\
+utton {\x0a  backgr\
+ound-color: #F0F\
+4F8;\x0a  color: #2\
+22222;\x0a  border:\
+ 1px solid #E0E6\
+ED;\x0a  padding: 6\
+px 12px;\x0a  borde\
+r-radius: 6px;\x0a \
+ font-weight: no\
+rmal;\x0a}\x0a\x0aQPushBu\
+tton:hover {\x0a  b\
+ackground-color:\
+ #E8EEF6;\x0a}\x0a\x0aQPu\
+shButton:disable\
+d {\x0a  background\
+-color: #EDEFF2;\
+\x0a  color: #9AA6B\
+2;\x0a}\x0a\x0a/* Make th\
+e Add Model butt\
+on the primary b\
+lue CTA and bold\
+ */\x0aQPushButton#\
+btnAddModel {\x0a  \
+background-color\
+: #007AFF;\x0a  col\
+or: #FFFFFF;\x0a  b\
+order: none;\x0a  f\
+ont-weight: 700;\
+\x0a}\x0a\x0a/* Top-bar b\
+uttons get a dis\
+tinct top-bar bl\
+ue (different fr\
+om Add Model CTA\
+) */\x0aQPushButton\
+#btnReload, QPus\
+hButton#btnImpor\
+t, QPushButton#b\
+tnEjectStorage {\
+\x0a  background-co\
+lor: #E0E6ED; /*\
+ grey */\x0a  color\
+: #222222;\x0a  bor\
+der: 1px solid #\
+D0D6DE;\x0a}\x0aQPushB\
+utton#btnReload:\
+hover, QPushButt\
+on#btnImport:hov\
+er, QPushButton#\
+btnEjectStorage:\
+hover { backgrou\
+nd-color: #D6DBE\
+0; }\x0a\x0a/* Top bar\
+ container backg\
+round (subtle bl\
+ue, distinct fro\
+m Add Model) */\x0a\
+QWidget#topBarFr\
+ame {\x0a  backgrou\
+nd-color: #EAF3F\
+F;\x0a}\x0a\x0a/* Card co\
+ntainer border *\
+/\x0aQWidget[card=\x22\
+true\x22] {\x0a  borde\
+r: 1px solid #E0\
+E6ED;\x0a  border-r\
+adius: 6px;\x0a  ba\
+ckground-color: \
+#FFFFFF;\x0a  paddi\
+ng: 6px;\x0a}\x0a/* Th\
+eme toggle butto\
+n: white in ligh\
+t mode */\x0aQPushB\
+utton#btnThemeTo\
+ggle {\x0a  backgro\
+und-color: #FFFF\
+FF;\x0a  color: #00\
+0000;\x0a  border: \
+1px solid #E0E6E\
+D;\x0a}\x0a\x0a/* Success\
+ / Error indicat\
+ors */\x0aQLabel[st\
+atus=\x22success\x22] \
+{ color: #34C759\
+; }\x0aQLabel[statu\
+s=\x22error\x22] { col\
+or: #FF3B30; }\x0a\x0a\
+QToolTip {\x0a  bac\
+kground-color: #\
+FFFFFF;\x0a  color:\
+ #222222;\x0a  bord\
+er: 1px solid #E\
+0E6ED;\x0a}\x0a\x0a/* Gal\
+lery thumbnail s\
+tyle */\x0aQLabel[t\
+humbnail=\x22true\x22]\
+ {\x0a  background-\
+color: #F5F7FA;\x0a\
+  border: 1px so\
+lid #E0E6ED;\x0a}\x0a\x0a\
+/* Gallery card \
+text */\x0aQLabel[c\
+ardHeader=\x22true\x22\
+] {\x0a  background\
+: transparent;\x0a \
+ padding-left: 1\
+2px;\x0a}\x0aQLabel[ca\
+rdSub=\x22true\x22] {\x0a\
+  background: tr\
+ansparent;\x0a  pad\
+ding-left: 16px;\
+\x0a}\x0a\x0a/* Modern sc\
+rollbars */\x0aQScr\
+ollBar:vertical \
+{\x0a  background: \
+transparent;\x0a  w\
+idth: 12px;\x0a  ma\
+rgin: 6px 3px 6p\
+x 0px;\x0a  border-\
+radius: 6px;\x0a}\x0aQ\
+ScrollBar:horizo\
+ntal {\x0a  backgro\
+und: transparent\
+;\x0a  height: 12px\
+;\x0a  margin: 0px \
+6px 3px 6px;\x0a  b\
+order-radius: 6p\
+x;\x0a}\x0aQScrollBar:\
+:handle:vertical\
+ {\x0a  background-\
+color: #CBD4E1;\x0a\
+  border-radius:\
+ 6px;\x0a  min-heig\
+ht: 28px;\x0a}\x0aQScr\
+ollBar::handle:v\
+ertical:hover, Q\
+ScrollBar::handl\
+e:vertical:press\
+ed {\x0a  backgroun\
+d-color: #AFC3E6\
+;\x0a}\x0aQScrollBar::\
+handle:horizonta\
+l {\x0a  background\
+-color: #CBD4E1;\
+\x0a  border-radius\
+: 6px;\x0a  min-wid\
+th: 28px;\x0a}\x0aQScr\
+ollBar::handle:h\
+orizontal:hover,\
+ QScrollBar::han\
+dle:horizontal:p\
+ressed {\x0a  backg\
+round-color: #AF\
+C3E6;\x0a}\x0aQScrollB\
+ar::add-line, QS\
+crollBar::sub-li\
+ne {\x0a  height: 0\
+px;\x0a  width: 0px\
+;\x0a}\x0aQScrollBar::\
+add-page, QScrol\
+lBar::sub-page {\
+\x0a  background: t\
+ransparent;\x0a}\x0a\x0a\
+\x00\x00\x05#\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M206.78-613.4\
+3H516.52 497.96 \
+505.74 206.78Zm4\
+43.39 0h103.05-1\
+03.05ZM235.78-71\
+3.78h488.44l-34-\
+40H269.78l-34 40\
+Zm174.39 258.69L\
+480-490l69.83 34\
+.91v-158.34H410.\
+17v158.34ZM206.7\
+8-100.78q-44.3 0\
+-75.15-30.85-30.\
+85-30.85-30.85-7\
+5.15v-471.87q0-1\
+9.09 6.48-36.33t\
+18.41-31.6l66.29\
+-79.68q14.39-17.\
+39 34.73-25.46 2\
+0.34-8.06 42.53-\
+8.06h421.56q22.1\
+9 0 42.53 8.06 2\
+0.34 8.07 34.73 \
+25.46l66.29 79.6\
+8q11.93 14.36 18\
+.41 31.6 6.48 17\
+.24 6.48 36.33v1\
+21.52q0 22.09-15\
+.46 37.54-15.46 \
+15.46-37.54 15.4\
+6-22.09 0-37.55-\
+15.46-15.45-15.4\
+5-15.45-37.54v-5\
+6.3H650.17V-500q\
+-46.3 21.13-80.7\
+8 57.41-34.48 36\
+.29-52.87 83.46L\
+480-377.39l-93.5\
+2 47.04q-26.78 1\
+3.39-51.72-2.34-\
+24.93-15.74-24.9\
+3-45.53v-235.21H\
+206.78v406.65H47\
+2q22.09 0 37.54 \
+15.45Q525-175.87\
+ 525-153.63q0 20\
+.93-15.24 36.89T\
+472-100.78H206.7\
+8Zm553.79 10.74q\
+-22.09 0-37.55-1\
+5.46-15.46-15.46\
+-15.46-37.54v-67\
+h-66.99q-22.09 0\
+-37.55-15.46-15.\
+46-15.46-15.46-3\
+7.54 0-22.09 15.\
+46-37.55 15.46-1\
+5.45 37.55-15.45\
+h66.99v-67q0-22.\
+09 15.46-37.55 1\
+5.46-15.45 37.55\
+-15.45 22.08 0 3\
+7.54 15.45 15.46\
+ 15.46 15.46 37.\
+55v67h67q22.08 0\
+ 37.54 15.45 15.\
+46 15.46 15.46 3\
+7.55 0 22.08-15.\
+46 37.54t-37.54 \
+15.46h-67v67q0 2\
+2.08-15.46 37.54\
+t-37.54 15.46ZM2\
+06.78-613.43H516\
+.52h-18.56H505.7\
+4 206.78Z\x22/></sv\
+g>\
+\x00\x00\x03\xcf\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M273.78-100.7\
+8q-44.3 0-75.15-\
+30.85-30.85-30.8\
+5-30.85-75.15v-5\
+07q-22.09 0-37.5\
+4-15.46-15.46-15\
+.46-15.46-37.54 \
+0-22.09 15.46-37\
+.55 15.45-15.45 \
+37.54-15.45H347q\
+0-22.09 15.46-37\
+.55 15.45-15.45 \
+37.54-15.45h158.\
+87q22.09 0 37.54\
+ 15.45 15.46 15.\
+46 15.46 37.55h1\
+80.35q22.09 0 37\
+.54 15.45 15.46 \
+15.46 15.46 37.5\
+5 0 22.08-15.46 \
+37.54-15.45 15.4\
+6-37.54 15.46v50\
+7q0 44.3-30.85 7\
+5.15-30.85 30.85\
+-75.15 30.85H273\
+.78Zm412.44-613H\
+273.78v507h412.4\
+4v-507ZM396.61-2\
+80.57q19.26 0 32\
+.74-13.47 13.48-\
+13.48 13.48-32.7\
+4v-267.57q0-19.2\
+6-13.48-32.74t-3\
+2.74-13.48q-19.2\
+6 0-33.02 13.48-\
+13.76 13.48-13.7\
+6 32.74v267.57q0\
+ 19.26 13.76 32.\
+74 13.76 13.47 3\
+3.02 13.47Zm167.\
+35 0q19.26 0 32.\
+74-13.47 13.47-1\
+3.48 13.47-32.74\
+v-267.57q0-19.26\
+-13.47-32.74-13.\
+48-13.48-32.74-1\
+3.48t-33.03 13.4\
+8q-13.76 13.48-1\
+3.76 32.74v267.5\
+7q0 19.26 13.76 \
+32.74 13.77 13.4\
+7 33.03 13.47ZM2\
+73.78-713.78v507\
+-507Z\x22/></svg>\
+\x00\x00\x06^\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M427-175.35 2\
+44.52-280.74q-24\
+.65-14.39-38.82-\
+38.61-14.18-24.2\
+2-14.18-53v-210.\
+78q0-28.78 14.18\
+-53 14.17-24.22 \
+38.82-38.61L427-\
+780.13q24.65-14.\
+39 53-14.39t53 1\
+4.39l182.48 105.\
+39q24.65 14.39 3\
+8.82 38.61 14.18\
+ 24.22 14.18 53v\
+210.78q0 28.78-1\
+4.18 53-14.17 24\
+.22-38.82 38.61L\
+533-175.35q-24.6\
+5 14.39-53 14.39\
+t-53-14.39Zm13-1\
+15.17v-163.65l-1\
+42.48-83.39v164.\
+65L440-290.52Zm8\
+0 0 142.48-82.39\
+v-164.65L520-454\
+.17v163.65Zm-410\
+.17-342.7q-20.4 \
+0-34.72-13.93-14\
+.33-13.94-14.33-\
+34.55v-111.52q0-\
+44.3 30.85-75.15\
+ 30.85-30.85 75.\
+15-30.85H278.3q2\
+0.4 0 34.72 13.9\
+4 14.33 13.94 14\
+.33 34.54 0 20.3\
+9-14.33 34.72-14\
+.32 14.32-34.72 \
+14.32h-120v120q0\
+ 20.61-13.93 34.\
+55-13.94 13.93-3\
+4.54 13.93Zm56.9\
+5 572.44q-44.3 0\
+-75.15-30.85-30.\
+85-30.85-30.85-7\
+5.15V-278.3q0-20\
+.4 14.33-34.72 1\
+4.32-14.33 34.72\
+-14.33 20.39 0 3\
+4.43 14.33 14.04\
+ 14.32 14.04 34.\
+72v120h120q20.4 \
+0 34.72 13.93 14\
+.33 13.94 14.33 \
+34.54 0 20.4-14.\
+33 34.72-14.32 1\
+4.33-34.72 14.33\
+H166.78Zm626.44 \
+0H681.7q-20.61 0\
+-34.55-14.33-13.\
+93-14.32-13.93-3\
+4.72 0-20.39 13.\
+93-34.43 13.94-1\
+4.04 34.55-14.04\
+h120v-120q0-20.4\
+ 14.32-34.72 14.\
+33-14.33 34.72-1\
+4.33t34.43 14.33\
+q14.05 14.32 14.\
+05 34.72v111.52q\
+0 44.3-30.85 75.\
+15-30.85 30.85-7\
+5.15 30.85Zm8.48\
+-620.92v-120h-12\
+0q-20.61 0-34.55\
+-14.32-13.93-14.\
+33-13.93-34.72t1\
+3.93-34.43q13.94\
+-14.05 34.55-14.\
+05h111.52q44.3 0\
+ 75.15 30.85 30.\
+85 30.85 30.85 7\
+5.15v111.52q0 20\
+.61-13.94 34.55-\
+13.94 13.93-34.5\
+4 13.93-20.39 0-\
+34.72-13.93-14.3\
+2-13.94-14.32-34\
+.55ZM480-523.74l\
+141.61-83.39L480\
+-689.09l-141.61 \
+81.96L480-523.74\
+Zm0 43.87Zm0-43.\
+87Zm40 69.57Zm-8\
+0 0Z\x22/></svg>\
+\x00\x00\x05\x02\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M495.39-293q7\
+7.91 0 132.46-54\
+.54 54.54-54.55 \
+54.54-132.46 0-7\
+7.91-54.54-132.4\
+6Q573.3-667 495.\
+39-667h-10.85q-5\
+.58 0-10.84.87-1\
+3.31 1.87-17.31 \
+14.96-4 13.08 6.\
+44 21.08 34.04 2\
+7.44 51.78 66.59\
+ 17.74 39.16 17.\
+74 83.5 0 44.61-\
+16.74 84.85-16.7\
+4 40.24-52.83 65\
+.24-10.82 8-7.32\
+ 20.8 3.5 12.81 \
+18.8 14.24 5.18.\
+87 10.6 1.37 5.4\
+3.5 10.53.5ZM343\
+.17-140.78h-96.3\
+9q-44.3 0-75.15-\
+30.85-30.85-30.8\
+5-30.85-75.15v-9\
+6.39l-61.74-62.7\
+4q-14.95-15.39-2\
+2.65-34.76-7.69-\
+19.36-7.69-39.39\
+t7.69-39.33q7.7-\
+19.31 22.65-34.7\
+l61.74-62.74v-96\
+.39q0-44.3 30.85\
+-75.15 30.85-30.\
+85 75.15-30.85h9\
+6.39l62.74-61.74\
+q15.96-14.95 35.\
+12-22.65 19.15-7\
+.69 38.97-7.69t3\
+8.97 7.69q19.16 \
+7.7 35.12 22.65l\
+62.74 61.74h96.3\
+9q44.3 0 75.15 3\
+0.85 30.85 30.85\
+ 30.85 75.15v96.\
+39l61.74 62.74q1\
+4.95 15.96 22.65\
+ 35.12 7.69 19.1\
+5 7.69 38.97t-7.\
+69 38.97q-7.7 19\
+.16-22.65 35.12l\
+-61.74 62.74v96.\
+39q0 44.3-30.85 \
+75.15-30.85 30.8\
+5-75.15 30.85h-9\
+6.39l-62.74 61.7\
+4q-15.39 14.95-3\
+4.76 22.65-19.36\
+ 7.69-39.39 7.69\
+t-39.33-7.69q-19\
+.31-7.7-34.7-22.\
+65l-62.74-61.74Z\
+m44.74-106L480-1\
+54.7l92.09-92.08\
+h141.13v-141.13L\
+805.3-480l-92.08\
+-92.09v-141.13H5\
+72.09L480-805.3l\
+-92.09 92.08H246\
+.78v141.13L154.7\
+-480l92.08 92.09\
+v141.13h141.13ZM\
+480-480Z\x22/></svg\
+>\
+\x00\x00\x03>\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M395.48-513.2\
+2q17 0 28.5-11.5\
+t11.5-28.5v-80q0\
+-17-11.5-28.5t-2\
+8.5-11.5q-17 0-2\
+8.5 11.5t-11.5 2\
+8.5v80q0 17 11.5\
+ 28.5t28.5 11.5Z\
+m119.43 0q17 0 2\
+8.5-11.5t11.5-28\
+.5v-80q0-17-11.5\
+-28.5t-28.5-11.5\
+q-17 0-28.5 11.5\
+t-11.5 28.5v80q0\
+ 17 11.5 28.5t28\
+.5 11.5Zm118.87 \
+0q17 0 28.5-11.5\
+t11.5-28.5v-80q0\
+-17-11.5-28.5t-2\
+8.5-11.5q-17 0-2\
+8.5 11.5t-11.5 2\
+8.5v80q0 17 11.5\
+ 28.5t28.5 11.5Z\
+m-387 452.44q-44\
+.3 0-75.15-30.85\
+-30.85-30.85-30.\
+85-75.15v-437.39\
+q0-21.23 7.98-40\
+.46 7.98-19.24 2\
+2.94-34.2L361.17\
+-868.3q14.96-14.\
+96 34.2-22.94 19\
+.23-7.98 40.46-7\
+.98h277.39q44.3 \
+0 75.15 30.85 30\
+.85 30.85 30.85 \
+75.15v626.44q0 4\
+4.3-30.85 75.15-\
+30.85 30.85-75.1\
+5 30.85H246.78Zm\
+0-106h466.44v-62\
+6.44H436.83L246.\
+78-603.33v436.55\
+Zm0 0h466.44-466\
+.44Z\x22/></svg>\
+\x00\x00\x04\xae\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M166.78-140.7\
+8q-44.3 0-75.15-\
+30.85-30.85-30.8\
+5-30.85-75.15v-4\
+66.44q0-44.3 30.\
+85-75.15 30.85-3\
+0.85 75.15-30.85\
+h626.44q44.3 0 7\
+5.15 30.85 30.85\
+ 30.85 30.85 75.\
+15v202.13q0 22.0\
+9-15.46 37.55-15\
+.46 15.45-37.54 \
+15.45-22.09 0-37\
+.55-15.45-15.45-\
+15.46-15.45-37.5\
+5v-109.69H166.78\
+v374h224.61q22.0\
+9 0 37.54 15.45 \
+15.46 15.46 15.4\
+6 37.55 0 22.08-\
+15.46 37.54-15.4\
+5 15.46-37.54 15\
+.46H166.78ZM752.\
+65 15.83q-58.69 \
+0-107.11-30.48Q5\
+97.13-45.13 570-\
+95.39q-8.13-14.2\
+6-1.94-29.74 6.2\
+-15.48 21.46-21.\
+04 13.83-5 27.09\
+.56 13.26 5.57 2\
+0.96 18.26Q655-9\
+6.61 685.46-77.7\
+4q30.45 18.87 67\
+.19 18.87 55.18 \
+0 93.91-38.74 38\
+.74-38.74 38.74-\
+93.91 0-55.18-38\
+.74-93.91-38.73-\
+38.74-93.91-38.7\
+4-20.65 0-39.71 \
+6.32-19.07 6.33-\
+35.68 18.98h12.1\
+7q13.57 1.7 22.0\
+7 12.46 8.5 10.7\
+6 8.5 24.89 0 15\
+.82-10.76 26.59-\
+10.76 10.76-26.5\
+9 10.76h-90q-19.\
+82 0-33.59-13.76\
+-13.76-13.77-13.\
+76-33.59v-90q0-1\
+5.83 10.76-26.59\
+ 10.77-10.76 26.\
+59-10.76 15.26 0\
+ 25.46 10.76 10.\
+19 10.76 11.89 2\
+6.02v11.74q28.43\
+-23.04 62.17-35.\
+78 33.74-12.74 7\
+0.48-12.74 86.39\
+ 0 146.87 60.48Q\
+960-277.91 960-1\
+91.52q0 86.39-60\
+.48 146.87-60.48\
+ 60.48-146.87 60\
+.48Z\x22/></svg>\
+\x00\x00\x02v\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M206.22-206.7\
+8h57.56l352.57-3\
+52.57-56.44-57-3\
+53.69 353.7v55.8\
+7Zm-52.44 106q-2\
+2.08 0-37.54-15.\
+46t-15.46-37.54v\
+-109.44q0-21.08 \
+7.98-40.39 7.98-\
+19.3 22.94-34.26\
+l495.95-495.52q1\
+3.13-12.7 29.33-\
+19.26 16.19-6.57\
+ 33.89-6.57 17.1\
+3 0 33.83 6.57 1\
+6.69 6.56 29.95 \
+19.69l79.31 78.6\
+1q13.13 12.7 19.\
+48 29.68 6.34 16\
+.97 6.34 34.24 0\
+ 17.69-6.34 34.1\
+7-6.35 16.48-19.\
+48 29.61L339-131\
+.7q-14.96 14.96-\
+34.26 22.94-19.3\
+ 7.98-40.39 7.98\
+H153.78Zm593.78-\
+589.65L691-747.5\
+6l56.56 57.13ZM5\
+87.91-587.91l-28\
+-28.44 56.44 57-\
+28.44-28.56Z\x22/><\
+/svg>\
+\x00\x00\x02q\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M375.48-307q-\
+114.09 0-193.55-\
+79.46-79.45-79.4\
+5-79.45-193.54 0\
+-114.09 79.45-19\
+3.54Q261.39-853 \
+375.48-853q114.0\
+9 0 193.54 79.46\
+ 79.46 79.45 79.\
+46 193.54 0 45.1\
+3-12.87 83.28T60\
+1-429.7l219.48 2\
+20.05q14.96 15.5\
+2 14.96 37.32 0 \
+21.81-15.53 36.7\
+7-14.95 14.95-37\
+.04 14.95t-37.04\
+-14.95L526.91-35\
+4.48q-29.43 21.7\
+4-68.15 34.61Q42\
+0.04-307 375.48-\
+307Zm0-106q69.91\
+ 0 118.45-48.54 \
+48.55-48.55 48.5\
+5-118.46t-48.55-\
+118.46Q445.39-74\
+7 375.48-747t-11\
+8.46 48.54Q208.4\
+8-649.91 208.48-\
+580t48.54 118.46\
+Q305.57-413 375.\
+48-413Z\x22/></svg>\
+\
+\x00\x00\x03\x08\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M440-353.78v8\
+0q0 17 11.5 28.5\
+t28.5 11.5q17 0 \
+28.5-11.5t11.5-2\
+8.5v-80h80q17 0 \
+28.5-11.5t11.5-2\
+8.5q0-17-11.5-28\
+.5t-28.5-11.5h-8\
+0v-80q0-17-11.5-\
+28.5t-28.5-11.5q\
+-17 0-28.5 11.5t\
+-11.5 28.5v80h-8\
+0q-17 0-28.5 11.\
+5t-11.5 28.5q0 1\
+7 11.5 28.5t28.5\
+ 11.5h80Zm-193.2\
+2 293q-44.3 0-75\
+.15-30.85-30.85-\
+30.85-30.85-75.1\
+5v-626.44q0-44.3\
+ 30.85-75.15 30.\
+85-30.85 75.15-3\
+0.85h277.39q21.2\
+3 0 40.46 7.98 1\
+9.24 7.98 34.2 2\
+2.94L788.3-678.8\
+3q14.96 14.96 22\
+.94 34.2 7.98 19\
+.23 7.98 40.46v4\
+37.39q0 44.3-30.\
+85 75.15-30.85 3\
+0.85-75.15 30.85\
+H246.78Zm266.44-\
+585.44v-147H246.\
+78v626.44h466.44\
+v-426.44h-147q-2\
+2.09 0-37.55-15.\
+45-15.45-15.46-1\
+5.45-37.55Zm-266\
+.44-147v200-200 \
+626.44-626.44Z\x22/\
+></svg>\
+\x00\x00\x02\xc0\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M166.78-140.7\
+8q-44.3 0-75.15-\
+30.85-30.85-30.8\
+5-30.85-75.15v-4\
+66.44q0-44.87 30\
+.85-75.43 30.85-\
+30.57 75.15-30.5\
+7h181q21.23 0 40\
+.46 7.98 19.24 7\
+.98 34.19 22.94L\
+480-730.74h366.2\
+2q22.08 0 37.54 \
+15.46 15.46 15.4\
+5 15.46 37.54t-1\
+5.46 37.54q-15.4\
+6 15.46-37.54 15\
+.46H436.26l-88.4\
+8-88.48h-181v469\
+.26l70.52-226.82\
+q10.83-33.35 38.\
+55-53.65 27.72-2\
+0.31 62.76-20.31\
+h471.91q54 0 85.\
+7 43.52 31.69 43\
+.53 15.61 94.53l\
+-53.92 174.43q-1\
+4.78 45.78-46.17\
+ 68.63-31.39 22.\
+85-78.31 22.85H1\
+66.78Zm112.83-10\
+6h471.35l59-191.\
+96H338.61l-59 19\
+1.96ZM166.78-470\
+.91v-242.31 242.\
+31Zm112.83 224.1\
+3 59-191.96-59 1\
+91.96Z\x22/></svg>\
+\x00\x00\x04~\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 height=\x222\
+4px\x22 viewBox=\x220 \
+-960 960 960\x22 wi\
+dth=\x2224px\x22 fill=\
+\x22#1f1f1f\x22><path \
+d=\x22M480-75.61q-1\
+3.19 0-26.38-3.3\
+5Q440.43-82.3 42\
+8.56-89L157.04-2\
+39.48q-25.28-14.\
+37-39.92-38.53-1\
+4.64-24.16-14.64\
+-53.51v-296.96q0\
+-29.35 14.64-53.\
+51 14.64-24.16 3\
+9.92-38.53L428.5\
+6-871q11.87-6.7 \
+25.06-10.04 13.1\
+9-3.35 26.38-3.3\
+5t26.38 3.35q13.\
+19 3.34 25.06 10\
+.04l271.52 150.4\
+8q25.28 14.37 39\
+.92 38.53 14.64 \
+24.16 14.64 53.5\
+1v296.96q0 29.35\
+-14.64 53.51-14.\
+64 24.16-39.92 3\
+8.53L531.44-89q-\
+11.87 6.7-25.06 \
+10.04-13.19 3.35\
+-26.38 3.35ZM362\
+.3-600.74q22.57-\
+21.87 52.07-34.8\
+ 29.5-12.94 65.6\
+3-12.94 36.13 0 \
+65.35 12.94 29.2\
+2 12.93 51.78 34\
+.8L698.48-657 48\
+0-777.83 261.52-\
+657l100.78 56.26\
+Zm69.22 392.04v-\
+110.08q-52.56-14\
+.57-86.28-58.2T3\
+11.52-480q0-9.3.\
+44-18.17.43-8.87\
+ 2.87-17.31L208.\
+48-575.3v243.48L\
+431.52-208.7Zm48\
+.56-199.78q29.53\
+ 0 50.48-21.03 2\
+0.96-21.03 20.96\
+-50.57 0-29.53-2\
+1.03-50.48-21.03\
+-20.96-50.57-20.\
+96-29.53 0-50.48\
+ 21.03-20.96 21.\
+03-20.96 50.57 0\
+ 29.53 21.03 50.\
+48 21.03 20.96 5\
+0.57 20.96Zm48.4\
+ 199.78 223.04-1\
+23.12V-575.3l-10\
+6.35 59.82q2.44 \
+8.87 2.87 17.52.\
+44 8.66.44 17.96\
+ 0 59.39-33.72 1\
+03.02-33.72 43.6\
+3-86.28 58.2v110\
+.08Z\x22/></svg>\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x06\
+\x07\xae\xc3\xc3\
+\x00t\
+\x00h\x00e\x00m\x00e\x00s\
+\x00\x08\
+\x08\x8eU\xe3\
+\x00d\
+\x00a\x00r\x00k\x00.\x00q\x00s\x00s\
+\x00\x09\
+\x0d\xf7\xbdC\
+\x00l\
+\x00i\x00g\x00h\x00t\x00.\x00q\x00s\x00s\
+\x00\x0c\
+\x04&\x92g\
+\x00n\
+\x00e\x00w\x00m\x00o\x00d\x00e\x00l\x00.\x00s\x00v\x00g\
+\x00\x0a\
+\x0c\xad\x02\x87\
+\x00d\
+\x00e\x00l\x00e\x00t\x00e\x00.\x00s\x00v\x00g\
+\x00\x10\
+\x04\xf4\x0c\x87\
+\x003\
+\x00d\x00v\x00i\x00e\x00w\x00b\x00u\x00t\x00t\x00o\x00n\x00.\x00s\x00v\x00g\
+\x00\x0f\
+\x03\xf4\x22g\
+\x00t\
+\x00o\x00g\x00g\x00l\x00e\x00t\x00h\x00e\x00m\x00e\x00.\x00s\x00v\x00g\
+\x00\x0b\
+\x0bOM\x87\
+\x00e\
+\x00j\x00e\x00c\x00t\x00s\x00d\x00.\x00s\x00v\x00g\
+\x00\x0a\
+\x05xB\xa7\
+\x00r\
+\x00e\x00l\x00o\x00a\x00d\x00.\x00s\x00v\x00g\
+\x00\x0e\
+\x0dtyG\
+\x00e\
+\x00d\x00i\x00t\x00b\x00u\x00t\x00t\x00o\x00n\x00.\x00s\x00v\x00g\
+\x00\x0a\
+\x08\x94m\xc7\
+\x00s\
+\x00e\x00a\x00r\x00c\x00h\x00.\x00s\x00v\x00g\
+\x00\x0c\
+\x04U;G\
+\x00a\
+\x00c\x00t\x00i\x00v\x00a\x00t\x00e\x00.\x00s\x00v\x00g\
+\x00\x0a\
+\x06\x99R'\
+\x00i\
+\x00m\x00p\x00o\x00r\x00t\x00.\x00s\x00v\x00g\
+\x00\x0b\
+\x052\xb4\xa7\
+\x00a\
+\x00p\x00p\x00l\x00o\x00g\x00o\x00.\x00s\x00v\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0b\x00\x00\x00\x05\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1CY\xe0\xf1\
+\x00\x00\x008\x00\x00\x00\x00\x00\x01\x00\x00\x122\
+\x00\x00\x01\xa1CY\xe0\xf1\
+\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x003\xd2\
+\x00\x00\x01\x9aNL\xf2h\
+\x00\x00\x00P\x00\x00\x00\x00\x00\x01\x00\x00$v\
+\x00\x00\x01\x9aNL\xf2h\
+\x00\x00\x01D\x00\x00\x00\x00\x00\x01\x00\x00E\xbb\
+\x00\x00\x01\x9aNL\xf2h\
+\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x00-p\
+\x00\x00\x01\x9aNL\xf2h\
+\x00\x00\x01|\x00\x00\x00\x00\x00\x01\x00\x00K\x8b\
+\x00\x00\x01\x9aNL\xf2h\
+\x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x00<\x1a\
+\x00\x00\x01\x9aNL\xf2h\
+\x00\x00\x01b\x00\x00\x00\x00\x00\x01\x00\x00H\xc7\
+\x00\x00\x01\x9aNL\xf2h\
+\x00\x00\x01*\x00\x00\x00\x00\x00\x01\x00\x00CF\
+\x00\x00\x01\x9aNL\xf2h\
+\x00\x00\x00\xd2\x00\x00\x00\x00\x00\x01\x00\x008\xd8\
+\x00\x00\x01\x9aNL\xf2h\
+\x00\x00\x00n\x00\x00\x00\x00\x00\x01\x00\x00)\x9d\
+\x00\x00\x01\x9aNL\xf2h\
+\x00\x00\x01\x08\x00\x00\x00\x00\x00\x01\x00\x00@\xcc\
+\x00\x00\x01\x9aNL\xf2h\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()